@@ -1,10 +1,12 @@
 # app.py
 import os
 import re
+import time
+from itertools import chain
 from dotenv import load_dotenv
 import streamlit as st
 from agents import AssistantClient
-from tools import get_error_message
+from tools import iter_error_messages, is_build_finished
 from tools import (
     extract_component_from_url,
     load_rules,
@@ -14,31 +16,74 @@ from tools import (
 from tools import login_to_polarion, get_test_case_by_id
 import truststore 
 
-truststore.inject_into_ssl()
-load_dotenv()
-MODEL_API=os.getenv("MODEL_API")
-MODEL_ID=os.getenv("MODEL_ID")
-MODEL_KEY=os.getenv("MODEL_KEY")
-POLARION_API=os.getenv("POLARION_API")
-POLARION_USER=os.getenv("POLARION_USER")
-POLARION_PASSWD=os.getenv("POLARION_PASSWORD")
-POLARION_PROJECT=os.getenv("POLARION_PROJECT")
-POLARION_TOKEN=os.getenv("POLARION_TOKEN")
-client = AssistantClient(
-    api_key=MODEL_KEY, base_url=MODEL_API, model=MODEL_ID)
+_RE_CASE_ID = re.compile(r"(?:RHACM4K|OCP)-\d+", re.IGNORECASE)
+_RE_GENERATE = re.compile(r"generate( automation)? scripts", re.IGNORECASE)
+_RE_JOB_URL = re.compile(r"(https?://\S*?/\d+)(?:[/\s]|$)")
+_RE_INTENT = re.compile(
+    r"(?P<regenerate>re-generate|generate again)|(?P<generate>generate|RHACM4K-)|(?P<analyse>analyse|http)",
+    re.IGNORECASE)
+_INTENT_PRIORITY = ("regenerate", "generate", "analyse")
+_INTENTS = {"generate": "generate_test_script", "analyse": "analyze_failure_url"}
 
-# Streamlit 
-def run_streamlit_app():
+# Created once per process instead of on every script rerun.
+# It also injects the system trust store and loads .env, so call it before reading the env.
+@st.cache_resource(show_spinner=False)
+def get_client():
+    truststore.inject_into_ssl()
+    load_dotenv()
+    return AssistantClient(
+        api_key=os.getenv("MODEL_KEY"), base_url=os.getenv("MODEL_API"), model=os.getenv("MODEL_ID"))
+
+# Streamlit reruns the whole script per message, keep the Polarion login and lookups across reruns
+@st.cache_resource
+def _polarion():
+    return login_to_polarion(
+        polarion_endpoint=os.getenv("POLARION_API"),
+        polarion_user=os.getenv("POLARION_USER"),
+        polarion_password=os.getenv("POLARION_PASSWORD"),
+        polarion_token=os.getenv("POLARION_TOKEN"))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _test_steps(polarion_id):
+    _, steps, _ = get_test_case_by_id(_polarion(), os.getenv("POLARION_PROJECT"), polarion_id)
+    return steps
+
+_FAILED_CASES_TTL = 600  # seconds
+
+# A finished Jenkins build is immutable, re-analysing the same job should not scrape it again.
+# On a miss the table grows as each case comes in. Only a non-empty list of a build that is no longer
+# running is kept: a failed fetch or the partial results of a running build are read again next time.
+def _failed_cases(job_url):
+    cache = st.session_state.setdefault("failed_cases_cache", {})
+    hit = cache.get(job_url)
+    if hit and time.monotonic() - hit[0] < _FAILED_CASES_TTL:
+        st.dataframe(hit[1])
+        return hit[1]
 
-    # Init chat history
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    placeholder = st.empty()
+    failed_cases = []
+    for case in iter_error_messages(job_url):
+        failed_cases.append(case)
+        placeholder.dataframe(failed_cases)
+    if failed_cases and is_build_finished(job_url):
+        cache[job_url] = (time.monotonic(), failed_cases)
+    else:
+        cache.pop(job_url, None)
+    return failed_cases
 
+@st.cache_data(show_spinner=False)
+def _rules(md_file):
+    return load_rules(md_file)
+
+# Streamlit 
+def run_streamlit_app():
     st.set_page_config(
      page_title="🛠️ AI Assistant System",
      layout="wide",
      initial_sidebar_state="expanded"
 )
+    client = get_client()
+
     st.title("🛠️ AI Assistant System")
     st.markdown("""
 Generate the automation scripts and analyse the failed case.
@@ -54,23 +99,19 @@ Generate the automation scripts and analyse the failed case.
     
    #  st.divider()
      
-    # manage chat states 
-    if "messages" not in st.session_state:
-      st.session_state.messages = []
-
-    if "last_intent" not in st.session_state:
-      st.session_state.last_intent = None
+    # manage chat states, only the first run of a session fills them in
+    defaults = {
+        "messages": [{"role": "system", "content": "You are a QA automation assistant."}],
+        "last_intent": None,
+        "last_suite_url": None,
+    }
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
 
-    if "last_suite_url" not in st.session_state:
-     st.session_state.last_suite_url = None
- 
-    # Initial chat records
-    if "messages" not in st.session_state:
-     st.session_state.messages = [
-        {"role": "system", "content": "You are a QA automation assistant."}
-    ]
     # show chat history
     for msg in st.session_state.messages:
+       if msg["role"] == "system":
+           continue
        with st.chat_message(msg["role"]):
         st.markdown(msg["content"])
 
@@ -92,46 +133,42 @@ Generate the automation scripts and analyse the failed case.
       with st.chat_message("user"):
         st.markdown(prompt)
       # Judge the intention
-      intent = None
-      if "generate" in prompt.lower() or "RHACM4K-" in prompt.lower():
-                   intent = "generate_test_script"
-      elif "re-generate" in prompt.lower() or "generate again" in prompt.lower():
-                   intent = st.session_state.last_intent
-      elif "analyse" in prompt.lower() or "http" in prompt.lower():
-                   intent = "analyze_failure_url"
-      elif "analyse" in prompt.lower() or "re-analyse" in prompt.lower():
-                   intent = st.session_state.last_intent
+      # one scan over the prompt, the earlier groups in _INTENT_PRIORITY win when several match
+      found = {m.lastgroup for m in _RE_INTENT.finditer(prompt)}
+      kind = next((k for k in _INTENT_PRIORITY if k in found), None)
+      if kind == "regenerate":
+                   intent = st.session_state.last_intent or "generate_test_script"
       else:
-            intent = None
+                   intent = _INTENTS.get(kind)
       # answer logic
       with st.chat_message("assistant"):
         with st.spinner("Thinking..."):
             reply = ""    
             if intent == "generate_test_script":
                     # the logic for generating automation scripts
-                     match = re.search(r"RHACM4K|OCP-\d+", prompt, re.IGNORECASE)
+                     match = _RE_CASE_ID.search(prompt)
                      #match = re.search(prompt, re.IGNORECASE)
                      if match:
-                      ploarion_client = login_to_polarion(polarion_endpoint=POLARION_API,polarion_user=POLARION_USER,polarion_password=POLARION_PASSWD, polarion_token=POLARION_TOKEN)  
                       polarion_id = match.group(0)
-                      project_id=POLARION_PROJECT  
-                      _, steps,_ = get_test_case_by_id(ploarion_client, project_id, polarion_id)
-                      feature_description = steps
+                      feature_description = _test_steps(polarion_id)
                      else:
-                       feature_description = re.sub(r"generate( automation)? scripts", "", prompt, flags=re.IGNORECASE).strip()  
+                       feature_description = _RE_GENERATE.sub("", prompt).strip()  
                      if feature_description:
-                            test_script = generate_test_script(client, feature_description)
-                            reply = f"**Automation scripts:**\n\n```\n{test_script}\n```"     
+                            st.markdown("**Automation scripts:**")
+                            test_script = st.write_stream(chain(["```\n"], generate_test_script(client, feature_description), ["\n```"]))
+                            reply = f"**Automation scripts:**\n\n{test_script}"
                      else:
                             reply = f"**No steps.**"
-                     st.markdown(reply)
+                            st.markdown(reply)
             elif intent == "analyze_failure_url":
                  # if not st.session_state.get("generated"):
                     # URL 
-                    url_match = re.match(r"^(.*?/\d+)/", prompt)
+                    # normalize to the build URL so ".../819", ".../819/" and ".../819/console" share one cache entry
+                    url_match = _RE_JOB_URL.search(prompt)
                     #match = re.match(r"^(.*?/\d+)/", url)
                 
                     url_name = url_match.group(1) if url_match else st.session_state.last_suite_url
+                    analysis = None
                     if not url_name:
                         reply = "Please provide the correct job URL. For example: https://jenkins-csb-rhacm-tests.dno.corp.redhat.com/view/Global%20Hub/job/globalhub-e2e/819"
                     else:
@@ -140,20 +177,19 @@ Generate the automation scripts and analyse the failed case.
                         if not component:
                            reply = f"Not find the component name"
                         else:   
-                           failed_cases = get_error_message(url_name)
+                           failed_cases = _failed_cases(url_name)
                            st.session_state['failed_cases'] = failed_cases
-                        if not failed_cases:
-                            reply = f"No found failed cases for url `{url_name}`."
-                        else:
-                            results = []
-                            guideline = load_rules("runbooks/component-keywords.md")     
-                            analysis = analyze_failed_case(client, component, failed_cases, guidelines_dict=guideline)
-                            #results.append(f"{analysis}")
-                            #reply = "\n\n---\n\n".join(results)
-                            reply = analysis
-                            st.session_state.last_intent = "analyze_failure_url" 
+                           if not failed_cases:
+                               reply = f"No found failed cases for url `{url_name}`."
+                           else:
+                               guideline = _rules("runbooks/component-keywords.md")
+                               analysis = analyze_failed_case(client, component, failed_cases, guidelines_dict=guideline)
+                               reply = st.write_stream(analysis)
+                               st.session_state.last_intent = "analyze_failure_url" 
                            # st.session_state.generated = True
-                    st.markdown(reply)
+                    # the analysis is already rendered by write_stream
+                    if analysis is None:
+                        st.markdown(reply)
                     col1, col2 = st.columns([1,1])
                     with col1:
                               if st.session_state.last_suite_url:
@@ -172,17 +208,8 @@ Generate the automation scripts and analyse the failed case.
                             #     st.session_state.need_rerun = True
                              #     st.session_state.rerun_prompt = f"re-analyze {st.session_state.last_suite_url}"               
             else:
-              # AI chat by default
-              # parse AI response
-              response = client.chat(st.session_state.messages)
-              if isinstance(response, str):
-                reply = response
-              elif isinstance(response, dict) and "choices" in response:
-                reply = response["choices"][0]["message"]["content"]
-              else:
-                 reply = "Unexpected AI response"
-            # show reply
-              st.markdown(reply)
+              # AI chat by default, show reply token by token
+              reply = st.write_stream(client.chat(st.session_state.messages))
             # save chat record
             st.session_state.messages.append({"role": "assistant", "content": reply})
             st.session_state.last_intent = intent
@@ -1,13 +1,25 @@
+import json
 from typing import Dict, List
-import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class AssistantClient:
     def __init__(self, api_key, base_url, model):
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
+        # keep-alive pool so every chat turn does not pay a new TCP/TLS handshake
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
     def chat(self, messages, **kwargs):
+        """
+        Stream the chat completion and yield the content deltas as they arrive.
+        Use chat_text() when the whole reply is needed as a string.
+        """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -16,27 +28,44 @@ class AssistantClient:
             "model": self.model,
             "messages": messages,
             #"messages": [{"role": "user", "content": prompt}],
-            **kwargs
+            **kwargs,
+            "stream": True
         }
-        print("Debug - Request Payload:", payload) 
+        print("Debug - Request Payload:", payload)
 
         try:
-          response = requests.post(f"{self.base_url.rstrip('/')}/v1/chat/completions", headers=headers, json=payload)
+          response = self._session.post(f"{self.base_url.rstrip('/')}/v1/chat/completions", headers=headers, json=payload, stream=True,
+                                        timeout=(5, 120))
           response.raise_for_status()
-          data = response.json()
-          message = data["choices"][0]["message"]["content"]
-          return message
         except requests.exceptions.HTTPError as e:
              print("Status code:", response.status_code)
              print("Response body:", response.text)
              print("HTTP Error Details:", e.response.text)
-             raise   
-    
+             raise
+        with response:
+          for raw in response.iter_lines():
+              # SSE frames look like "data: {...}", blank lines and ":" comments are keep-alives
+              line = raw.decode("utf-8")
+              if not line or not line.startswith("data:"):
+                  continue
+              data = line[len("data:"):].strip()
+              if data == "[DONE]":
+                  break
+              chunk = json.loads(data)
+              if not chunk.get("choices"):
+                  continue
+              content = chunk["choices"][0].get("delta", {}).get("content")
+              if content:
+                  yield content
+
+    def chat_text(self, messages, **kwargs):
+        return "".join(self.chat(messages, **kwargs))
+
     def __call__(self, prompt, *args, **kwargs):
         if isinstance(prompt, str):
             messages = [{"role": "user", "content": prompt}]
         elif isinstance(prompt, list):
             messages = prompt
         else:
-            raise ValueError("prompt must be str or list of messages")       
-        return self.chat(messages, **kwargs)
+            raise ValueError("prompt must be str or list of messages")
+        return self.chat_text(messages, **kwargs)
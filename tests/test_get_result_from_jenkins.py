@@ -0,0 +1,84 @@
+import json
+import unittest
+from unittest import mock
+
+from tools import get_result_from_jenkins
+
+BUILD_URL = "https://jenkins.example.com/job/qe-acm/job/grc-e2e-test-execution/2737/console"
+
+# Trimmed /testReport/api/json answer of a Cypress run, case names are the raw titles
+REPORT = {
+    "_class": "hudson.tasks.junit.TestResult",
+    "suites": [
+        {
+            "cases": [
+                {
+                    "className": "RHACM4K-3471: GRC: [P1][Sev1][policy-grc] Create a policy",
+                    "name": "RHACM4K-3471: GRC: [P1][Sev1][policy-grc] Create a policy",
+                    "status": "REGRESSION",
+                    "errorDetails": "Timed out retrying after 30000ms\n",
+                    "errorStackTrace": "AssertionError: Timed out\n    at Context.eval",
+                },
+                {
+                    "className": "RHACM4K-1234: GRC: List policies",
+                    "name": "RHACM4K-1234: GRC: List policies",
+                    "status": "PASSED",
+                    "errorDetails": None,
+                    "errorStackTrace": None,
+                },
+                {
+                    "className": "RHACM4K-5678: GRC: Delete a policy",
+                    "name": "RHACM4K-5678: GRC: Delete a policy",
+                    "status": "FAILED",
+                    "errorDetails": None,
+                    "errorStackTrace": "Error: policy still present",
+                },
+            ]
+        }
+    ],
+}
+
+
+def _api_returning(report):
+    return mock.patch.object(get_result_from_jenkins, "_get",
+                             return_value=json.dumps(report).encode())
+
+
+class GetErrorMessageApiTest(unittest.TestCase):
+
+    def test_reads_failed_cases_from_raw_names(self):
+        with _api_returning(REPORT):
+            results = get_result_from_jenkins.get_error_message_api(BUILD_URL)
+
+        self.assertEqual([r["ID"] for r in results], ["RHACM4K-3471", "RHACM4K-5678"])
+        self.assertTrue(results[0]["Title"].startswith("P1 Sev1 policy grc Create a policy"))
+        self.assertEqual(results[0]["Error Message"], "Timed out retrying after 30000ms")
+        self.assertEqual(results[1]["Error Message"], "")
+        self.assertEqual(results[1]["Stacktrace Message"], "Error: policy still present")
+
+    def test_no_failures_is_an_empty_list(self):
+        report = {"suites": [{"cases": [REPORT["suites"][0]["cases"][1]]}]}
+        with _api_returning(report):
+            self.assertEqual(get_result_from_jenkins.get_error_message_api(BUILD_URL), [])
+
+    def test_unreadable_failures_fall_back_to_html(self):
+        report = {"suites": [{"cases": [{"className": "smoke", "name": "login", "status": "FAILED"}]}]}
+        with _api_returning(report):
+            self.assertIsNone(get_result_from_jenkins.get_error_message_api(BUILD_URL))
+
+
+class IsBuildFinishedTest(unittest.TestCase):
+
+    def test_building_state(self):
+        for state, finished in ((False, True), (True, False)):
+            with _api_returning({"_class": "hudson.model.FreeStyleBuild", "building": state}):
+                self.assertIs(get_result_from_jenkins.is_build_finished(BUILD_URL), finished)
+
+    def test_unreadable_state_is_not_finished(self):
+        with mock.patch.object(get_result_from_jenkins, "_get",
+                               side_effect=get_result_from_jenkins.requests.ConnectionError("down")):
+            self.assertFalse(get_result_from_jenkins.is_build_finished(BUILD_URL))
+
+
+if __name__ == "__main__":
+    unittest.main()
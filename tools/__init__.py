@@ -1,3 +1,3 @@
-from .get_result_from_jenkins import get_error_message
-from .get_test_steps_from_polarion import get_test_case_by_id, login_to_polarion
+from .get_result_from_jenkins import get_error_message, iter_error_messages, is_build_finished
+from .get_test_steps_from_polarion import get_test_case_by_id, get_test_cases_by_ids, login_to_polarion
 from .utils import extract_component_from_url, load_rules, analyze_failed_case, generate_test_script
\ No newline at end of file
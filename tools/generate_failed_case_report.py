@@ -1,8 +1,18 @@
+import html
 import webbrowser
 import os
 import argparse
 import json
 
+ROW_TEMPLATE = """
+      <tr>
+        <td>{}</td>
+        <td>{}</td>
+        <td>{}</td>
+        <td>{}</td>
+      </tr>
+    """
+
 # --- Main execution ---
 def main():
     parser = argparse.ArgumentParser(description='Generate an HTML report for failed test cases.')
@@ -40,29 +50,25 @@ def main():
       </tr>
     """
 
-    # Populate the table with data
+    # Populate the table with data, escaped so '<' or '&' in error messages can't break the markup
+    parts = [html_content]
     for case in failed_cases:
-        html_content += f"""
-      <tr>
-        <td>{case.get('ID', 'N/A')}</td>
-        <td>{case.get('Title', 'N/A')}</td>
-        <td>{case.get('Error Message', 'N/A')}</td>
-        <td>{case.get('Analysis', 'N/A')}</td>
-      </tr>
-    """
+        parts.append(ROW_TEMPLATE.format(
+            *(html.escape(str(case.get(key, 'N/A'))) for key in ('ID', 'Title', 'Error Message', 'Analysis'))
+        ))
 
     # Close the HTML tags
-    html_content += """
+    parts.append("""
     </table>
 
     </body>
     </html>
-    """
+    """)
 
     # Write the HTML content to a file
     file_path = "failure_analysis_report.html"
     with open(file_path, "w") as f:
-        f.write(html_content)
+        f.write("".join(parts))
 
     # Open the HTML file in a web browser
     webbrowser.open('file://' + os.path.realpath(file_path))
@@ -1,33 +1,219 @@
 import re
+import json
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 
+# Shared keep-alive session, all fetches hit the same Jenkins host
+# At most _MAX_WORKERS requests are in flight, which is also the pool size so every worker keeps its connection
+_MAX_WORKERS = 16
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=_MAX_WORKERS,
+                       max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+# Jenkins is reached without certificate verification, silence the warning once instead of on every request.
+# verify=False stays on the calls: a session-level verify is overridden when REQUESTS_CA_BUNDLE is set.
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def fetch_webpage(url):
+_RE_BUILD_URL = re.compile(r"(.*?/\d+)(?:/|$)")
+_RE_CASE = re.compile(r"RHACM4K_\d+")
+# Jenkins' URL-safe form of a case name, the HTML ids and report paths have every non-word character as "_"
+_RE_UNSAFE = re.compile(r"\W")
+_RE_TEST_PREFIX = re.compile(r"^test-")
+# case paths look like RHACM4K_<n>__<component>__<title words>/<test name>
+_RE_TITLE = re.compile(r"RHACM4K_\d+.*?__.*?__(.*)$")
+_TITLE_SEPARATORS = str.maketrans({"_": " ", "/": " "})
+
+# Only build the parts of the report pages that get_error_message reads
+_FAILURE_SUMMARY_STRAINER = SoupStrainer("div", class_="failure-summary")
+_PRE_STRAINER = SoupStrainer("pre", id=re.compile(r"-(?:error|stacktrace)"))
+
+# One request returns every case of the build, instead of one summary page per failed case
+_REPORT_API = "/testReport/api/json?tree=suites[cases[className,name,status,errorDetails,errorStackTrace]]"
+_FAILED_STATUSES = ("FAILED", "REGRESSION")
+
+
+def _get(url):
+    # Raises on failure
+    response = _SESSION.get(url, verify=False, timeout=(3, 10))
+    response.raise_for_status()
+    # raw bytes, lxml detects the encoding itself so skip decoding to str here
+    return response.content
+
+
+# A case's summary page only exists once the case has finished and does not change after that,
+# so successful fetches are kept. The report index and the API grow while a build runs and are never cached.
+_cached_get = lru_cache(maxsize=512)(_get)
+
+
+def fetch_webpage(url, cached=False):
     """
     Fetch the content of a webpage.
 
     :param url: The URL of the webpage to fetch.
-    :return: The content of the webpage as a string.
+    :param cached: Reuse an earlier successful fetch of the same URL, only for pages that never change.
+    :return: The raw content of the webpage as bytes.
     """
     try:
-        # Send a GET request to the specified URL
-        response = requests.get(url, verify=False)
-        # Check if the request was successful (status code 200)
-        response.raise_for_status()
-        # Get the content of the webpage
-        webpage_content = response.text
-        return webpage_content
+        return _cached_get(url) if cached else _get(url)
     except requests.RequestException as e:
         print(f"Error fetching the webpage: {e}")
         return None
 
 
-def parse_webpage(content):
-    soup = BeautifulSoup(content, "html.parser")
+def _fetch_case_summary(url):
+    return fetch_webpage(url, cached=True)
+
+
+def parse_webpage(content, parse_only=None):
+    soup = BeautifulSoup(content, "lxml", parse_only=parse_only)
     return soup
 
 
+def _case_result(real_id, real_id_con, error_text, stack_text):
+    """
+    Build the result row for one failed case.
+
+    :param real_id: The RHACM4K_<n> id found in the case name.
+    :param real_id_con: The full case path, used to derive the title.
+    """
+    case_id = real_id.replace("_", "-")
+    m = _RE_TITLE.search(real_id_con)
+    title = " ".join(m.group(1).translate(_TITLE_SEPARATORS).split()) if m else ""
+    print(f"ID: {case_id}\nTitle: {title}\nError Message: \n{error_text}\nStacktrace Message: \n{stack_text}\n")
+    return {
+        "ID": case_id,
+        "Title": title,
+        "Error Message": error_text,
+        "Stacktrace Message": stack_text
+    }
+
+
+def is_build_finished(url):
+    """
+    Tell whether a Jenkins build has finished, so that its results will not change any more.
+
+    :param url: A Jenkins build URL, e.g. .../job/<name>/<build>/console.
+    :return: True once the build is no longer running. False while it runs or when its state can not be read.
+    """
+    real_url = _RE_BUILD_URL.match(url).group(0)
+    try:
+        data = json.loads(_get(real_url + "/api/json?tree=building"))
+    except (requests.RequestException, ValueError) as e:
+        print(f"Build state not available: {e}")
+        return False
+    return data.get("building") is False
+
+
+def get_error_message_api(url):
+    """
+    Read the failed cases of a build from the Jenkins JSON API in a single request.
+
+    :param url: A Jenkins build URL, e.g. .../job/<name>/<build>/console.
+    :return: The same list as get_error_message, or None when the API can not be used
+             so that the caller can fall back to scraping the HTML report.
+    """
+    real_url = _RE_BUILD_URL.match(url).group(0)
+    try:
+        data = json.loads(_get(real_url + _REPORT_API))
+    except (requests.RequestException, ValueError) as e:
+        print(f"Test report API not available, falling back to the HTML report: {e}")
+        return None
+    # aggregated reports (matrix/multijob) keep their cases under childReports instead
+    if "suites" not in data:
+        return None
+
+    final_results = []
+    failed_count = 0
+    for suite in data["suites"]:
+        for case in suite.get("cases", []):
+            if case.get("status") not in _FAILED_STATUSES:
+                continue
+            failed_count += 1
+            # the API returns the raw names (RHACM4K-3471: GRC: ...), bring them to the safe form
+            # the HTML report uses so that the same case id and title rules apply
+            real_id_con = "/".join(_RE_UNSAFE.sub("_", case.get(key) or "") for key in ("className", "name"))
+            match = _RE_CASE.search(real_id_con)
+            if not match:
+                continue
+            final_results.append(_case_result(
+                match.group(), real_id_con,
+                (case.get("errorDetails") or "").strip(),
+                (case.get("errorStackTrace") or "").strip()))
+    if failed_count and not final_results:
+        # failed cases the API names can not be read from, let the HTML report have a go
+        return None
+    return final_results
+
+
+def iter_error_messages(url):
+    """
+    Yield the failed cases of a Jenkins build one at a time, each as soon as its details are fetched.
+    The Jenkins JSON API is tried first, the HTML test report is only scraped when it is not available.
+
+    Args:
+        url (str): The URL of the webpage from which to fetch and extract error messages.
+
+    Yields:
+        dict: One failed case with its "ID", "Title", "Error Message" and "Stacktrace Message".
+    """
+
+    api_results = get_error_message_api(url)
+    if api_results is not None:
+        yield from api_results
+        return
+
+    # Fetch the webpage content
+    real_url = _RE_BUILD_URL.match(url).group(0)
+    webpage_content = fetch_webpage(real_url+"/testReport/")
+    if not webpage_content:
+        return
+    # Parse the webpage content
+    soup = parse_webpage(webpage_content, parse_only=_FAILURE_SUMMARY_STRAINER)
+    # Search all hidden contents
+    hidden_content = soup.find_all("div", class_="failure-summary")
+    # one pass, read the parsed id attribute and only render the text when the id does not tell
+    matching_ids = []
+    for div in hidden_content:
+        div_id = div.get("id")
+        if div_id and ("RHACM4K" in div_id or "RHACM4K" in div.get_text()):
+            matching_ids.append(div_id)
+    # Find all hidden link contents
+    # resolve each case path once, before any fetch, and drop repeats and ids without a case number
+    # so that no summary page is requested twice or for nothing
+    cases = []
+    for id_ in matching_ids:
+        real_id = _RE_TEST_PREFIX.sub("", id_)
+        match = _RE_CASE.search(real_id)
+        if match:
+            cases.append((match.group(), real_id.replace("&quot;", '"')))
+    cases = list(dict.fromkeys(cases))
+    error_msg_urls = [real_url + "/testReport/" + real_id_con + "/summary" for _, real_id_con in cases]
+    # The summary pages are independent, fetch them concurrently over the shared session
+    # and hand each case out in report order as soon as its page is in
+    with ThreadPoolExecutor(max_workers=max(1, min(_MAX_WORKERS, len(error_msg_urls)))) as executor:
+        error_contents = executor.map(_fetch_case_summary, error_msg_urls)
+        for key, error_content in zip(cases, error_contents):
+            if not error_content:
+                continue
+            error_soup = parse_webpage(error_content, parse_only=_PRE_STRAINER)
+            texts = {}
+            # one walk over the <pre> tags, classified by their id
+            for pre_tag in error_soup.find_all("pre"):
+                pid = pre_tag["id"]
+                if "-error" in pid and pre_tag.get("style") == "display: ":
+                    texts["error_text"] = pre_tag.get_text(strip=True)
+                elif "-stacktrace" in pid:
+                    texts["stacktrace_text"] = pre_tag.get_text(strip=True)
+            if texts:
+                yield _case_result(*key, texts.get("error_text", ""), texts.get("stacktrace_text", ""))
+
+
 def get_error_message(url):
     """
     Retrieves error messages from a given URL and extracts case IDs along with their corresponding error messages.
@@ -36,92 +222,42 @@ def get_error_message(url):
         url (str): The URL of the webpage from which to fetch and extract error messages.
 
     Returns:
-        list: A list of tuples containing case IDs and their associated error messages.
-              Each tuple is in the format (error_id, error_text).
+        list: A list of dicts, one per failed case, as yielded by iter_error_messages.
     """
+    return list(iter_error_messages(url))
 
-    # Initialize final_results
-    final_results = []
 
-    # Fetch the webpage content
-    real_url = re.match(r"(.*?/\d+)(?:/|$)", url).group(0)
-    webpage_content = fetch_webpage(real_url+"/testReport/")
-    if webpage_content:
-        # Parse the webpage content
-        soup = parse_webpage(webpage_content)
-        # Example: Print the title of the webpage
-        title = soup.title.string if soup.title else "No title found"
-        print(f"Title of the webpage: {title}")
-        # Search all hidden contents
-        hidden_content = soup.find_all("div", class_="failure-summary")
-        contains_text = [div for div in hidden_content if "RHACM4K" in str(div)]
-        results = []
-        matching_ids = [
-            re.search(r'id="([^"]+)"', str(div)).group(1) for div in contains_text
-        ]
-        # Find all hidden link contents
-        error_dict = {}
-        for id_ in matching_ids:
-            real_id = re.sub(r"^test-", "", id_)
-            real_id_con = real_id.replace("&amp;quot;", '"')
-            error_msg_url = real_url + "/testReport/" + real_id_con + "/summary"
-            error_content = fetch_webpage(error_msg_url)
-            if error_content:
-                error_soup = parse_webpage(error_content)
-                error_elements = error_soup.find_all(
-                    "pre", style="display: ", id=lambda x: x and "-error" in x
-                )
-                if error_elements:
-                    for pre_tag in error_elements:
-                        error_text = pre_tag.get_text(strip=True)
-                        pattern = r"RHACM4K_\d+"
-                        match = re.search(pattern, real_id)
-                        if match:
-                            key = (match.group(), real_id_con)
-                            if key not in error_dict:
-                               error_dict[key] = {"error_text": "", "stacktrace_text": ""}
-                            error_dict[key]["error_text"] = error_text
-                 
-               
-                stacktrace_elements = error_soup.find_all(
-                        "pre", id=lambda x: x and "-stacktrace" in x
-                    )
-                if stacktrace_elements:
-                    for pre_tag in stacktrace_elements:
-                        stack_text = pre_tag.get_text(strip=True)
-                        pattern = r"RHACM4K_\d+"
-                        match = re.search(pattern, real_id)
-                        if match:
-                            key = (match.group(), real_id_con)
-                            if key not in error_dict:
-                               error_dict[key] = {"error_text": "", "stacktrace_text": ""}
-                            error_dict[key]["stacktrace_text"] = stack_text
-        # print and return results
-        #for item in results:
-        #  if len(item) == 4:
-        #    real_id, error_text, stack_text, real_id_con=item
-        #  elif len(item) == 3:
-        #    real_id, error_text, real_id_con=item
-        #    stack_text = ""
-        #  else:
-        #    continue
-        for (real_id, real_id_con), texts in error_dict.items():  
-          case_id = re.sub(r"_", "-", real_id)
-          index = real_id_con.find(real_id) 
-          substring = real_id_con[index + len(real_id):] 
-          substring=substring[substring.find("__", substring.find("__") + 2) + 2:]
-          substring = substring.replace("_", " ").replace("/", " ")
-          title =  " ".join(substring.split())
-          error_text = texts.get("error_text", "")
-          stack_text = texts.get("stacktrace_text", "")
-          final_results.append({
-            "ID": case_id,
-            "Title": title,
-            "Error Message": error_text,
-            "Stacktrace Message": stack_text
-        })
-          print(f"ID: {case_id}\nTitle: {title}\nError Message: \n{error_text}\nStacktrace Message: \n{stack_text}\n")
-    return final_results
+
+def get_failed_case_summary(url, case_id):
+    """
+    Retrieves the console log of one failed case from a Jenkins build.
+
+    The console is streamed line by line and the read stops at the first "FAILED" line
+    after the case, so large consoles are never held in memory as a whole.
+
+    Args:
+        url (str): The URL of the Jenkins build, e.g. .../job/<name>/<build>/console.
+        case_id (str): The case id to look for in the console, e.g. RHACM4K-1234.
+
+    Returns:
+        str: The console lines from the first mention of the case up to its "FAILED" line,
+             or an empty string when the case is not found.
+    """
+    real_url = _RE_BUILD_URL.match(url).group(0)
+    case_log = []
+    try:
+        with _SESSION.get(real_url + "/consoleText", stream=True, verify=False, timeout=(3, 30)) as response:
+            response.raise_for_status()
+            for raw in response.iter_lines():
+                line = raw.decode("utf-8", errors="replace")
+                if not case_log and case_id not in line:
+                    continue
+                case_log.append(line)
+                if line.strip() == "FAILED":
+                    break
+    except requests.RequestException as e:
+        print(f"Error fetching the console log: {e}")
+    return "\n".join(case_log)
 
 
 
@@ -1,8 +1,17 @@
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 import certifi
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # faster decoding of the large log pages when available, same result as json.loads
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 load_dotenv()
 
 #LOG_FORMAT = '%(asctime)s | %(levelname)7s | %(name)s | line:%(lineno)4s | %(message)s)'
@@ -11,17 +20,40 @@ load_dotenv()
 base_url = os.getenv("RP_ENDPOINT")
 rp_api_token = os.getenv("RP_APITOKEN")
 project = os.getenv("RP_PROJECT")
+# (connect, read) seconds, keeps a stuck Report Portal from hanging the caller
+TIMEOUT = (5, 30)
+# larger pages mean fewer round trips for big launches and long error logs
+PAGE_SIZE = 300
 headers = {'Authorization': 'Bearer ' + rp_api_token, "Content-Type": "application/json"}
 
-try:
-       cwd = os.getcwd()
+# Shared keep-alive session with the auth headers, every call goes to the same Report Portal host
+_SESSION = requests.Session()
+_SESSION.headers.update(headers)
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                       max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+_rp_cert_checked = False
+
+def _ensure_rp_cert():
+    """
+    Check the connection to Report Portal once, on first use instead of at import time,
+    and add the custom certs to the certifi store when the check fails.
+    """
+    global _rp_cert_checked
+    if _rp_cert_checked:
+        return
+    _rp_cert_checked = True
+    cwd = os.getcwd()
+    try:
        logging.info('Checking connection to Report Portal...')
        params = {
         'filter.eq.name': "any_report"
       }
-       response = requests.get(f"{base_url}/api/v1/{project}/launch/latest", params=params, headers=headers).json()
+       _SESSION.get(f"{base_url}/api/v1/{project}/launch/latest", params=params, timeout=TIMEOUT).raise_for_status()
        logging.info('Connection to Report Portal OK.')
-except Exception:
+    except Exception:
        logging.info('SSL Error. Adding custom certs to Certifi store...')
        cafile = certifi.where()
        with open(f"{cwd}/certificates/cert1.pem", 'rb') as infile:
@@ -31,6 +63,7 @@ except Exception:
        logging.info('That might have worked.')
 
 def get_launch_id_by_name(launch):
+    _ensure_rp_cert()
     url = f"{base_url}/api/v1/{project}/launch"
     page = 1
     page_size = 50
@@ -49,76 +82,66 @@ def get_launch_id_by_name(launch):
             "page.page": page,
             "page.size": page_size
         }
-        response = requests.get(url, headers=headers, params=params)
-        data = response.json()
+        response = _SESSION.get(url, params=params, timeout=TIMEOUT)
+        data = json_loads(response.content)
 
         launches = data.get('content', [])
         for launch in launches:
             return launch['id']
 
-        if data['page']['number'] + 1 >= data['page']['totalPages']:
+        # page numbers are 1-based, page == totalPages is the last one
+        if page >= data['page']['totalPages']:
             break
         page += 1
 
     print(f"Launch is not found: {launch}")
     return None
 
-def get_failed_test_items(launch_id):
-    url = f"{base_url}/api/v1/{project}/item"
-    page = 1
-    page_size = 100
-    failed_items = []
+def get_all_pages(url, params, max_workers=10):
+    """
+    Collect the "content" of every page of a paginated Report Portal list.
+    Page 1 tells how many pages there are, the remaining ones are fetched concurrently.
+    """
+    _ensure_rp_cert()
+    def get_page(page):
+        response = _SESSION.get(url, params={**params, "page.page": page}, timeout=TIMEOUT)
+        return json_loads(response.content)
+
+    first = get_page(1)
+    total_pages = first.get('page', {}).get('totalPages', 1)
+    rest = []
+    if total_pages > 1:
+        # never more workers than pages left, nor than the connections the session keeps
+        with ThreadPoolExecutor(max_workers=min(max_workers, total_pages - 1)) as executor:
+            rest = list(executor.map(get_page, range(2, total_pages + 1)))
+    content = []
+    for data in [first, *rest]:
+        content.extend(data.get('content', []))
+    return content
 
-    while True:
-        params = {
-            "filter.eq.launchId": launch_id,
-            "filter.eq.hasChildren": "false",
-            "filter.eq.status": "FAILED",
-            "page.page": page,
-            "page.size": page_size
-        }
-        response = requests.get(url, headers=headers, params=params)
-        data = response.json()
-        items = data.get('content', [])
-        for item in items:
-             failed_items.append({
-                "id": item["id"],
-                "name": item["name"],
-            })
-        if data['page']['number'] + 1 >= data['page']['totalPages']:
-            break
-        page += 1
 
-    return failed_items
+def get_failed_test_items(launch_id):
+    url = f"{base_url}/api/v1/{project}/item"
+    params = {
+        "filter.eq.launchId": launch_id,
+        "filter.eq.hasChildren": "false",
+        "filter.eq.status": "FAILED",
+        "page.size": PAGE_SIZE
+    }
+    return [{"id": item["id"], "name": item["name"]} for item in get_all_pages(url, params)]
 
 
 def get_logs_for_test_item(item_id):
     url = f"{base_url}/api/v1/{project}/log"
-    logs = []
-    page = 1
-    page_size = 100
-    while True:
-        params = {
-            "filter.eq.item": item_id,
-            "filter.eq.level": "ERROR",
-            "page.page": page,
-            "page.size": page_size
-        }
-        response = requests.get(url, headers=headers, params=params)
-        data = response.json()
-        entries = data.get('content', [])
-
-        for entry in entries:
-            logs.append({
-                "time": entry['time'],
-                "level": entry['level'],
-                "message": entry['message']
-            })
-        if data['page']['number'] + 1 >= data['page']['totalPages']:
-            break
-        page += 1
-
-    return logs
+    params = {
+        "filter.eq.item": item_id,
+        "filter.eq.level": "ERROR",
+        "page.size": PAGE_SIZE
+    }
+    return [
+        {"time": entry['time'], "level": entry['level'], "message": entry['message']}
+        for entry in get_all_pages(url, params)
+    ]
 
 
 def main(launch):
@@ -30,23 +30,51 @@ def login_to_polarion(polarion_endpoint, polarion_user, polarion_password, polar
     return polarion_client
 
 
+def _get_project(polarion_client, project_id):
+    """
+    Return the project of the client, every getProject is a SOAP round trip
+    so the handle is kept on the client and looked up once per project.
+    """
+    project_cache = getattr(polarion_client, "_project_cache", None)
+    if project_cache is None:
+        project_cache = polarion_client._project_cache = {}
+    if project_id not in project_cache:
+        project_cache[project_id] = polarion_client.getProject(project_id)
+    return project_cache[project_id]
+
+
 def get_test_case_by_id(polarion_client, project_id, case_id):
     """
     polarion_client: Polarion client
     project_id: project ID (ex: RHACM4K)
     case_id: test case ID (ex: RHACM4K-xxx)
-    return: tuple: (test_case, test_steps)
+    return: tuple: (test_case, test_steps, test_component)
     """
-    project = polarion_client.getProject(project_id)
+    project = _get_project(polarion_client, project_id)
     target_case=project.getWorkitem(case_id)
     
     if not target_case:
         print(f"Not find the test case {case_id}")
-        return None, []
+        return None, [], None
     test_steps = target_case.getTestSteps()
     test_component = target_case.getCustomField('casecomponent')
     print(f"Test case: \n{target_case.title}")
     print(f"\nTest steps: \n{test_steps}")
     print(f"\nTest component: \n{test_component}")
 
-    return target_case, test_steps, test_component
\ No newline at end of file
+    return target_case, test_steps, test_component
+
+def get_test_cases_by_ids(polarion_client, project_id, case_ids):
+    """
+    polarion_client: Polarion client
+    project_id: project ID (ex: RHACM4K)
+    case_ids: test case IDs (ex: [RHACM4K-xxx, RHACM4K-yyy])
+    return: list of the matching work item records, fetched with one query instead of one getWorkitem per case.
+            Each record only carries id, title, test steps and case component.
+    """
+    if not case_ids:
+        return []
+    project = _get_project(polarion_client, project_id)
+    query = "id:(" + " OR ".join(case_ids) + ")"
+    return project.searchWorkitem(
+        query, field_list=["id", "title", "customFields.testSteps", "customFields.casecomponent"])
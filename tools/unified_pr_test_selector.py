@@ -34,19 +34,34 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
+import mmap
 import os
 import re
 import sys
 import subprocess
 import tempfile
 import shutil
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
 from datetime import datetime
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, Iterator, List, Set, Tuple, Optional
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote
 import urllib3
+try:
+    # faster JSON for GitHub payloads and the tag index when available, same data as the json module
+    from orjson import loads as json_loads, dumps as json_dumps_bytes
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -226,6 +241,195 @@ FILE_TO_TAG_MAPPINGS = {
     },
 }
 
+def _fuse_path_patterns(path_to_tags: Dict[str, frozenset]) -> Tuple[re.Pattern, List[Tuple[str, frozenset]]]:
+    """
+    Fuse all path patterns of a component into one regex.
+
+    Every rule becomes an optional lookahead with its own named group, so a single
+    match() at position 0 reports every rule that re.search() would have matched,
+    and the tags of all of them are still unioned.
+    """
+    lookaheads = []
+    group_tags = []
+    for i, (pattern, tags) in enumerate(path_to_tags.items()):
+        lookaheads.append(f'(?=(?:.*?(?P<g{i}>{pattern}))?)')
+        group_tags.append((f'g{i}', tags))
+    return re.compile(''.join(lookaheads)), group_tags
+
+
+# A run of literal characters, with regex metacharacters only as backslash escapes
+_LITERAL_RE = re.compile(r'(?:\\[^A-Za-z0-9]|[^.^$*+?{}\[\]\\|()])+')
+
+
+def _classify_path_pattern(pattern: str) -> Tuple[str, str]:
+    """
+    Classify a path pattern as ('suffix', text), ('substring', text) or ('regex', pattern).
+
+    Patterns are applied with re.search(), so '.*\\.md$' is a plain suffix test and
+    'agent/', 'controllers/.*' or '.*ansible.*' are plain substring tests.
+    """
+    core = pattern[2:] if pattern.startswith('.*') else pattern
+    kind = 'substring'
+    if core.endswith('$') and not core.endswith('\\$'):
+        # only a leading '.*' makes the end anchor a plain suffix test
+        if core is pattern:
+            return 'regex', pattern
+        core, kind = core[:-1], 'suffix'
+    elif core.endswith('.*') and not core.endswith('\\.*'):
+        core = core[:-2]
+    if not core or not _LITERAL_RE.fullmatch(core):
+        return 'regex', pattern
+    return kind, re.sub(r'\\(.)', r'\1', core)
+
+
+def _compile_rules(rules: Dict) -> Dict:
+    literal_rules = []
+    regex_rules = {}
+    for pattern, tags in rules['path_to_tags'].items():
+        # rules without tags (docs, tests, CI files) never add anything, skip matching them
+        if not tags:
+            continue
+        tags = frozenset(tags)
+        kind, text = _classify_path_pattern(pattern)
+        if kind == 'regex':
+            regex_rules[pattern] = tags
+        else:
+            literal_rules.append((kind, text, tags))
+    path_regex, path_group_tags = _fuse_path_patterns(regex_rules) if regex_rules else (None, [])
+    critical_patterns = rules['critical_patterns']
+    return {
+        # fixed-string rules are checked with str.endswith / in, the rest share one fused regex
+        'path_literals': literal_rules,
+        'path_regex': path_regex,
+        'path_group_tags': path_group_tags,
+        # an empty alternation would match every file, leave it out instead
+        'critical_regex': re.compile('|'.join(f'(?:{p})' for p in critical_patterns)) if critical_patterns else None,
+    }
+
+
+# Mapping rules compiled once at import, TagBasedSelector runs them against every changed file
+_COMPILED_MAPPINGS = {component: _compile_rules(rules) for component, rules in FILE_TO_TAG_MAPPINGS.items()}
+
+# Repository name keywords per component, checked in order, the first component with a hit wins
+_COMPONENT_KEYWORDS = (
+    # Global Hub component
+    ('global-hub', ('global-hub', 'multicluster-global-hub', 'glo-grafana')),
+    # GRC component - multiple development repositories
+    ('grc', (
+        'config-policy-controller',
+        'governance-policy-framework-addon',
+        'governance-policy-framework',
+        'governance-policy-propagator',
+        'governance-policy-addon-controller',
+        'cert-policy-controller',
+        'policy',  # generic policy repos
+        'gatekeeper',
+    )),
+    # Search component - multiple development repositories
+    ('search', (
+        'search-v2-api',
+        'search-collector',
+        'search-v2-operator',
+        'search-indexer',
+        'search',  # generic search repos
+    )),
+    # Application Lifecycle (ALC) component
+    ('alc', ('application',)),
+    # Cluster Lifecycle (CLC) component
+    ('clc', ('cluster', 'lifecycle')),
+)
+
+
+@lru_cache(maxsize=256)
+def detect_component(repo_name: str) -> str:
+    """Detect component from repository name"""
+    repo_lower = repo_name.lower()
+    for component, keywords in _COMPONENT_KEYWORDS:
+        if any(keyword in repo_lower for keyword in keywords):
+            return component
+    return 'unknown'
+
+
+_PR_URL_RE = re.compile(r'github\.com/([^/]+)/([^/]+)/pull/(\d+)')
+# Polarion test case number in a test name, e.g. 'RHACM4K-3471: ...' -> '3471'
+_RHACM4K_RE = re.compile(r'RHACM4K-(\d+)')
+
+
+def _extract_test_number(name: str) -> Optional[str]:
+    match = _RHACM4K_RE.search(name)
+    return match.group(1) if match else None
+
+
+def _test_number(test: Dict) -> Optional[str]:
+    """
+    RHACM4K number of a test dict. The parsers store it as '_rhacm4k_num',
+    tests from elsewhere get it extracted once and memoized on the dict.
+    """
+    try:
+        return test['_rhacm4k_num']
+    except KeyError:
+        number = test['_rhacm4k_num'] = _extract_test_number(test['name'])
+        return number
+
+
+def _greedy_tag_cover(tag_coverage: Dict[str, int], min_tests_per_tag: int) -> Iterator[Tuple[str, int]]:
+    """
+    Greedy set cover over tag -> test bitmask, yields the picked (tag, mask) pairs in order.
+
+    Each pick is the tag covering the most still uncovered tests, as long as that is at
+    least min_tests_per_tag. A tag's gain only shrinks as tests get covered, so heap entries
+    are upper bounds and are re-evaluated lazily when they reach the top instead of
+    rescanning every tag per pick.
+    """
+    covered = 0
+    heap = [(-mask.bit_count(), tag) for tag, mask in tag_coverage.items()
+            if mask.bit_count() >= min_tests_per_tag]
+    heapq.heapify(heap)
+    while heap and -heap[0][0] >= min_tests_per_tag:
+        _, tag = heapq.heappop(heap)
+        mask = tag_coverage[tag]
+        gain = (mask & ~covered).bit_count()
+        if gain < min_tests_per_tag:
+            # can only shrink further, this tag will never qualify
+            continue
+        if heap and gain < -heap[0][0]:
+            # stale bound, another tag may cover more now
+            heapq.heappush(heap, (-gain, tag))
+            continue
+        covered |= mask
+        yield tag, mask
+
+
+def _sorted_display_tags(tags) -> List[str]:
+    """Functional tags alphabetically, then test numbers numerically"""
+    functional, numbers = [], []
+    for tag in tags:
+        (numbers if tag.isdigit() else functional).append(tag)
+    functional.sort()
+    numbers.sort()
+    numbers.sort(key=int)  # stable, so equal values keep their string order
+    functional.extend(numbers)
+    return functional
+
+# PR metadata and its changed files in one request, files are paged 100 at a time by cursor
+_PR_GRAPHQL_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      title
+      changedFiles
+      author { login }
+      files(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { path additions deletions changeType }
+      }
+    }
+  }
+}
+"""
+# GraphQL changeType -> REST file status
+_CHANGE_TYPE_STATUS = {'DELETED': 'removed'}
+
 
 class PRAnalyzer:
     """Analyzes GitHub Pull Requests"""
@@ -235,11 +439,15 @@ class PRAnalyzer:
         self.headers = {}
         if self.github_token:
             self.headers['Authorization'] = f'token {self.github_token}'
+        # One keep-alive session for all GitHub calls, PRs of a batch are fetched concurrently
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
 
     def parse_pr_url(self, pr_url: str) -> Tuple[str, str, int]:
         """Extract owner, repo, and PR number from PR URL"""
-        pattern = r'github\.com/([^/]+)/([^/]+)/pull/(\d+)'
-        match = re.search(pattern, pr_url)
+        match = _PR_URL_RE.search(pr_url)
         if not match:
             raise ValueError(f"Invalid GitHub PR URL: {pr_url}")
         owner, repo, pr_number = match.groups()
@@ -247,73 +455,53 @@ class PRAnalyzer:
 
     def detect_component(self, repo_name: str) -> str:
         """Detect component from repository name"""
-        repo_lower = repo_name.lower()
-
-        # Global Hub component
-        if 'global-hub' in repo_lower or 'multicluster-global-hub' in repo_lower or 'glo-grafana' in repo_lower:
-            return 'global-hub'
-
-        # GRC component - multiple development repositories
-        elif any(x in repo_lower for x in [
-            'config-policy-controller',
-            'governance-policy-framework-addon',
-            'governance-policy-framework',
-            'governance-policy-propagator',
-            'governance-policy-addon-controller',
-            'cert-policy-controller',
-            'policy',  # generic policy repos
-            'gatekeeper'
-        ]):
-            return 'grc'
-
-        # Search component - multiple development repositories
-        elif any(x in repo_lower for x in [
-            'search-v2-api',
-            'search-collector',
-            'search-v2-operator',
-            'search-indexer',
-            'search'  # generic search repos
-        ]):
-            return 'search'
-
-        # Application Lifecycle (ALC) component
-        elif 'application' in repo_lower:
-            return 'alc'
-
-        # Cluster Lifecycle (CLC) component
-        elif 'cluster' in repo_lower or 'lifecycle' in repo_lower:
-            return 'clc'
-
-        return 'unknown'
-
-    def get_pr_info(self, pr_url: str) -> Dict:
-        """Get PR information and changed files"""
-        owner, repo, pr_number = self.parse_pr_url(pr_url)
-
-        print(f"\n{'='*80}")
-        print(f"📥 Fetching PR #{pr_number}...")
-        print(f"{'='*80}")
+        return detect_component(repo_name)
 
+    def _fetch_pr_graphql(self, owner: str, repo: str, pr_number: int) -> Tuple[str, str, int, List[Dict]]:
+        """Get PR title, author, changed file count and changed files with the GraphQL API"""
+        variables = {'owner': owner, 'repo': repo, 'number': pr_number, 'cursor': None}
+        changed_files = []
+        while True:
+            response = self.session.post('https://api.github.com/graphql',
+                                         json={'query': _PR_GRAPHQL_QUERY, 'variables': variables}, timeout=30)
+            response.raise_for_status()
+            payload = json_loads(response.content)
+            if payload.get('errors'):
+                raise RuntimeError(f"GitHub GraphQL error: {payload['errors'][0].get('message')}")
+            pr_data = payload['data']['repository']['pullRequest']
+            files = pr_data['files']
+            for file_info in files['nodes']:
+                change_type = file_info['changeType']
+                changed_files.append({
+                    'filename': file_info['path'],
+                    'status': _CHANGE_TYPE_STATUS.get(change_type, change_type.lower()),
+                    'additions': file_info['additions'],
+                    'deletions': file_info['deletions'],
+                })
+            if not files['pageInfo']['hasNextPage']:
+                break
+            variables['cursor'] = files['pageInfo']['endCursor']
+
+        # author is null for deleted accounts
+        author = (pr_data['author'] or {}).get('login', 'ghost')
+        return pr_data['title'], author, pr_data['changedFiles'], changed_files
+
+    def _fetch_pr_rest(self, owner: str, repo: str, pr_number: int) -> Tuple[str, str, int, List[Dict]]:
+        """Get PR title, author, changed file count and changed files with the REST API (GraphQL needs a token)"""
         # Get PR basic info
         api_url = f'https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}'
-        response = requests.get(api_url, headers=self.headers)
+        response = self.session.get(api_url, timeout=30)
         response.raise_for_status()
-        pr_data = response.json()
-
-        # Detect component
-        component = self.detect_component(repo)
-
-        print(f"✅ PR #{pr_number}: {pr_data['title']}")
-        print(f"   Repository: {owner}/{repo}")
-        print(f"   Component: {component}")
-        print(f"   Author: {pr_data['user']['login']}")
-        print(f"   Files changed: {pr_data['changed_files']}")
+        pr_data = json_loads(response.content)
 
-        # Get changed files
-        files_url = f'https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/files'
-        files_response = requests.get(files_url, headers=self.headers)
-        files_response.raise_for_status()
-        files_data = files_response.json()
+        # Get changed files, 100 per page (the default is 30) and following the Link header for larger PRs
+        files_url = f'https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/files?per_page=100'
+        files_data = []
+        while files_url:
+            files_response = self.session.get(files_url, timeout=30)
+            files_response.raise_for_status()
+            files_data.extend(json_loads(files_response.content))
+            files_url = files_response.links.get('next', {}).get('url')
 
         changed_files = []
         for file_info in files_data:
@@ -324,10 +512,35 @@ class PRAnalyzer:
                 'deletions': file_info['deletions'],
             })
 
+        return pr_data['title'], pr_data['user']['login'], pr_data['changed_files'], changed_files
+
+    def get_pr_info(self, pr_url: str) -> Dict:
+        """Get PR information and changed files"""
+        owner, repo, pr_number = self.parse_pr_url(pr_url)
+
+        print(f"\n{'='*80}")
+        print(f"📥 Fetching PR #{pr_number}...")
+        print(f"{'='*80}")
+
+        if self.github_token:
+            title, author, changed_count, changed_files = self._fetch_pr_graphql(owner, repo, pr_number)
+        else:
+            title, author, changed_count, changed_files = self._fetch_pr_rest(owner, repo, pr_number)
+
+        # Detect component
+        component = self.detect_component(repo)
+
+        # One print per PR so the lines stay together when several PRs are fetched at once
+        print(f"✅ PR #{pr_number}: {title}\n"
+              f"   Repository: {owner}/{repo}\n"
+              f"   Component: {component}\n"
+              f"   Author: {author}\n"
+              f"   Files changed: {changed_count}")
+
         return {
             'pr_number': pr_number,
-            'title': pr_data['title'],
-            'author': pr_data['user']['login'],
+            'title': title,
+            'author': author,
             'repo': f"{owner}/{repo}",
             'component': component,
             'changed_files': changed_files,
@@ -335,12 +548,245 @@ class PRAnalyzer:
         }
 
 
+# Test file patterns, compiled once and shared by the extraction workers.
+# Files are scanned as memory-mapped bytes, only the captured groups are decoded.
+# Search component format: describe('...', { tags: tags.env }, ...)
+_SPEC_TAG_MAPPINGS = {
+    'tags.env': ['CANARY', 'ROSA'],
+    'tags.modes': ['BVT', 'SVT'],
+    'tags.required': ['REQUIRED'],
+}
+# describe() and it() are found in one finditer pass, the branch that matched is told by its named group
+_SPEC_SCAN_RE = re.compile(
+    rb'(?P<describe>describe\s*\(\s*["\']([^"\']+)["\']\s*,\s*\{\s*tags:\s*(tags\.\w+)\s*\})'
+    rb"|(?P<it>(?i:it\s*\(\s*['\"]([^'\"]*(?:RHACM4K|P\d|Sev\d)[^'\"]*)['\"]))")
+# Cypress format: describe('test name', { tags: ['@tag1', '@tag2'] }, ...) and it('RHACM4K-xxxxx: ...', { tags: [...] }, ...)
+_CYPRESS_SCAN_RE = re.compile(
+    rb'(?P<describe>describe\s*\(\s*["\']([^"\']+)["\']\s*,\s*\{\s*tags:\s*\[([^\]]+)\]\s*\})'
+    rb"|(?P<it>(?i:it\s*\(\s*['\"]([^'\"]*RHACM4K-(\d+)[^'\"]*)['\"](?:\s*,\s*\{\s*tags:\s*\[([^\]]+)\]\s*\})?))")
+_QUOTED_RE = re.compile(r"['\"]([^'\"]+)['\"]")
+# Generic Cypress tags that say nothing about the functionality under test
+_GENERIC_CYPRESS_TAGS = {'non-ui', 'uitest', 'ui'}
+# Ginkgo format: ginkgo.Describe("suite name", ginkgo.Label("tag1", "tag2"), ...) and It("RHACM4K-xxxxx: ...", ...)
+_GINKGO_DESCRIBE_RE = re.compile(rb'ginkgo\.Describe\("([^"]+)",\s*ginkgo\.Label\(([^)]+)\)')
+_GINKGO_IT_RE = re.compile(rb'It\("(RHACM4K-\d+:[^"]+)"')
+_GINKGO_IT_PREFIX = b'It("RHACM4K-'
+# Bump when the parsing above changes, so tag indexes cached by older versions are not reused
+TAG_INDEX_VERSION = 3
+# Dependency trees never hold the component's own tests
+_SKIPPED_DIRS = {'node_modules', 'vendor'}
+
+
+def _decode(value: bytes) -> str:
+    return value.decode('utf-8', errors='ignore')
+
+
+def _parse_spec(content: bytes, rel_path: str, tag_to_tests: Dict[str, List[Dict]], all_tags: Set[str]):
+    """Extract tests from a search component spec.js file"""
+    # Search component format: describe('...', { tags: tags.env }, ...)
+    # Every it() is listed under every tagged describe block
+    describes = []
+    test_names = []
+    for match in _SPEC_SCAN_RE.finditer(content):
+        if match.group('describe') is not None:
+            describes.append((_decode(match.group(2)), _decode(match.group(3))))
+        else:
+            test_name = _decode(match.group(5))
+            test_names.append((test_name, _extract_test_number(test_name)))
+
+    for suite_name, tag_ref in describes:
+        # Map tag reference to actual tags
+        labels = _SPEC_TAG_MAPPINGS.get(tag_ref, [])
+        for label in labels:
+            all_tags.add(label)
+
+        for test_name, test_number in test_names:
+            test_info = {
+                'name': test_name,
+                'suite': suite_name,
+                'file': rel_path,
+                'tags': labels,
+                '_rhacm4k_num': test_number,
+            }
+
+            # Add to each tag's test list
+            for tag in labels:
+                if tag not in tag_to_tests:
+                    tag_to_tests[tag] = []
+                tag_to_tests[tag].append(test_info)
+
+
+def _parse_cypress(content: bytes, rel_path: str, tag_to_tests: Dict[str, List[Dict]], all_tags: Set[str]):
+    """Extract tests from a Cypress .cy.js file"""
+    # Cypress format:
+    # describe('test name', { tags: ['@tag1', '@tag2'] }, () => {
+    #   it('RHACM4K-xxxxx: test description', { tags: ['@xxxxx'] }, () => {...})
+    # })
+
+    # Only the first describe block names the suite, it() cases anywhere in the file belong to it
+    describe_match = None
+    it_matches = []
+    for match in _CYPRESS_SCAN_RE.finditer(content):
+        if match.group('describe') is None:
+            it_matches.append(match)
+        elif describe_match is None:
+            describe_match = match
+
+    if not describe_match:
+        return
+
+    suite_name = _decode(describe_match.group(2))
+    tags_str = _decode(describe_match.group(3))
+
+    # Parse describe-level tags (remove @ prefix and quotes)
+    describe_tags = []
+    for tag in _QUOTED_RE.findall(tags_str):
+        tag_clean = tag.lstrip('@')
+        if tag_clean:
+            describe_tags.append(tag_clean)
+            all_tags.add(tag_clean)
+
+    # it() test cases with their individual tags
+    # Pattern: it('RHACM4K-12345: test description', { tags: ['@12345', '@other'] }, () => {...})
+    # or: it('RHACM4K-12345: test description', () => {...})
+    for match in it_matches:
+        test_name = _decode(match.group(5))
+        test_number = _decode(match.group(6))  # Extract the number part (e.g., "12345")
+        it_tags_str = match.group(7)  # Optional it-level tags
+
+        # Parse it-level tags
+        it_tags = []
+        if it_tags_str:
+            for tag in _QUOTED_RE.findall(_decode(it_tags_str)):
+                tag_clean = tag.lstrip('@')
+                if tag_clean:
+                    it_tags.append(tag_clean)
+                    all_tags.add(tag_clean)
+
+        # Combine describe tags and it tags
+        # Filter out generic tags like 'non-ui' and 'uitest'
+        combined_tags = [tag for tag in describe_tags + it_tags if tag not in _GENERIC_CYPRESS_TAGS]
+
+        # Always add the test case number as a tag (without @ prefix)
+        if test_number and test_number not in combined_tags:
+            combined_tags.append(test_number)
+            all_tags.add(test_number)
+
+        test_info = {
+            'name': test_name,
+            'suite': suite_name,
+            'file': rel_path,
+            'tags': combined_tags,
+            '_rhacm4k_num': _extract_test_number(test_name),
+        }
+
+        # Add to each tag's test list
+        for tag in combined_tags:
+            if tag not in tag_to_tests:
+                tag_to_tests[tag] = []
+            tag_to_tests[tag].append(test_info)
+
+
+def _iter_ginkgo_its(content: bytes):
+    """
+    Yield the _GINKGO_IT_RE matches of content, like finditer().
+
+    Every match starts with the literal 'It("RHACM4K-', so the content is scanned with
+    find() for it and the pattern only runs anchored at those offsets.
+    """
+    pos = content.find(_GINKGO_IT_PREFIX)
+    while pos != -1:
+        match = _GINKGO_IT_RE.match(content, pos)
+        if match:
+            yield match
+            pos = content.find(_GINKGO_IT_PREFIX, match.end())
+        else:
+            pos = content.find(_GINKGO_IT_PREFIX, pos + 1)
+
+
+def _parse_ginkgo(content: bytes, rel_path: str, tag_to_tests: Dict[str, List[Dict]], all_tags: Set[str]):
+    """Extract tests from a Ginkgo _test.go file"""
+    # Ginkgo format: ginkgo.Describe("suite name", ginkgo.Label("tag1", "tag2"), ...)
+    describe_match = _GINKGO_DESCRIBE_RE.search(content)
+
+    if not describe_match:
+        return
+
+    suite_name = _decode(describe_match.group(1))
+    labels_str = _decode(describe_match.group(2))
+
+    # Parse Ginkgo labels
+    labels = []
+    for label in labels_str.split(','):
+        label = label.strip().strip('"').strip("'")
+        if label:
+            labels.append(label)
+            all_tags.add(label)
+
+    # Extract It() test cases within this suite
+    # Pattern: It("RHACM4K-xxxxx: test description", ...)
+    for match in _iter_ginkgo_its(content):
+        test_name = _decode(match.group(1))
+        test_info = {
+            'name': test_name,
+            'suite': suite_name,
+            'file': rel_path,
+            'tags': labels,
+            '_rhacm4k_num': _extract_test_number(test_name),
+        }
+
+        # Add to each tag's test list
+        for tag in labels:
+            if tag not in tag_to_tests:
+                tag_to_tests[tag] = []
+            tag_to_tests[tag].append(test_info)
+
+
+# Test file suffix -> parser, files are bucketed by kind before parsing
+_TEST_FILE_PARSERS = {
+    '.spec.js': _parse_spec,
+    '.cy.js': _parse_cypress,
+    '_test.go': _parse_ginkgo,
+}
+
+
+def _parse_test_file(parser, file_path: str, repo_path: str) -> Tuple[Dict[str, List[Dict]], Set[str]]:
+    """
+    Extract test tags and cases from a single file with the parser of its kind
+
+    Pure function of the file so it can run in a worker process.
+    Returns: ({tag: [test_case_dicts]}, all_tags) for this file only
+    """
+    tag_to_tests = {}
+    all_tags = set()
+    rel_path = os.path.relpath(file_path, repo_path)
+
+    try:
+        # mmap cannot map an empty file, and an empty file has no tests
+        if os.path.getsize(file_path):
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                parser(content, rel_path, tag_to_tests, all_tags)
+    except Exception as e:
+        print(f"⚠️  Error reading {rel_path}: {e}")
+
+    return tag_to_tests, all_tags
+
+
 class TestRepository:
     """Manages test repository operations"""
 
-    def __init__(self, component: str, work_dir: str = None):
+    def __init__(self, component: str, work_dir: str = None, use_cache: bool = True, offline: bool = False):
         self.component = component
-        self.work_dir = work_dir or tempfile.mkdtemp(prefix=f'acm-test-{component}-')
+        # Without an explicit work_dir the clone is kept in the user cache and only updated on the next run
+        self.use_cache = use_cache and not work_dir
+        # Offline runs use the cached clone as it is, without contacting the remote
+        self.offline = offline
+        if self.use_cache:
+            cache_home = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache'))
+            self.work_dir = str(cache_home / 'acm-qe-assistant' / component)
+            os.makedirs(self.work_dir, exist_ok=True)
+        else:
+            self.work_dir = work_dir or tempfile.mkdtemp(prefix=f'acm-test-{component}-')
         self.repo_path = None
 
         if component not in COMPONENT_TEST_REPOS:
@@ -359,6 +805,38 @@ class TestRepository:
 
         self.repo_path = os.path.join(self.work_dir, self.component + '-tests')
 
+        if self.offline:
+            if not (self.use_cache and os.path.isdir(os.path.join(self.repo_path, '.git'))):
+                raise RuntimeError(f"Offline mode needs a cached clone of {repo_url}, run once without --offline first")
+            print(f"✅ Using cached repository without updating it (offline): {self.repo_path}")
+            return self.repo_path
+
+        if self.use_cache and os.path.isdir(os.path.join(self.repo_path, '.git')):
+            try:
+                cmd = ['git', '-C', self.repo_path, 'fetch', '--depth', '1', 'origin', 'HEAD']
+                subprocess.run(cmd, check=True, capture_output=True, text=True)
+                cmd = ['git', '-C', self.repo_path, 'reset', '--hard', 'FETCH_HEAD']
+                subprocess.run(cmd, check=True, capture_output=True, text=True)
+                print(f"✅ Cached repository updated: {self.repo_path}")
+                return self.repo_path
+            except subprocess.CalledProcessError as e:
+                print(f"⚠️  Failed to update the cached repository, cloning again: {e.stderr}")
+                shutil.rmtree(self.repo_path, ignore_errors=True)
+
+        # Only the test files are read: a blobless sparse clone downloads just their contents
+        sparse_patterns = ['*' + pattern.rsplit('*', 1)[-1] for pattern in self.repo_config['test_patterns']]
+        try:
+            cmd = ['git', 'clone', '--depth', '1', '--filter=blob:none', '--sparse', repo_url, self.repo_path]
+            subprocess.run(cmd, check=True, capture_output=True, text=True)
+            cmd = ['git', '-C', self.repo_path, 'sparse-checkout', 'set', '--no-cone', *sparse_patterns]
+            subprocess.run(cmd, check=True, capture_output=True, text=True)
+            print(f"✅ Repository cloned successfully")
+            return self.repo_path
+        except subprocess.CalledProcessError as e:
+            # Older git or a server without partial clone support, use a plain shallow clone
+            print(f"⚠️  Sparse clone failed, falling back to a full shallow clone: {e.stderr}")
+            shutil.rmtree(self.repo_path, ignore_errors=True)
+
         try:
             cmd = ['git', 'clone', '--depth', '1', repo_url, self.repo_path]
             subprocess.run(cmd, check=True, capture_output=True, text=True)
@@ -368,6 +846,21 @@ class TestRepository:
             print(f"❌ Failed to clone repository: {e.stderr}")
             raise
 
+    def _find_test_files(self) -> List[str]:
+        """
+        Walk the repository once and collect the files matching any of the '**/*<suffix>' test patterns.
+        Hidden directories (like .git), node_modules and vendor are not descended into.
+        """
+        suffixes = tuple(pattern.rsplit('*', 1)[-1] for pattern in self.repo_config['test_patterns'])
+        test_files = []
+        for dirpath, dirnames, filenames in os.walk(self.repo_path):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d not in _SKIPPED_DIRS)
+            test_files.extend(
+                os.path.join(dirpath, name) for name in sorted(filenames)
+                if name.endswith(suffixes) and not name.startswith('.')
+            )
+        return test_files
+
     def extract_test_tags(self) -> Dict[str, List[Dict]]:
         """
         Extract all test tags from repository using Ginkgo Label declarations
@@ -380,191 +873,101 @@ class TestRepository:
         print(f"🔍 Extracting test tags from repository...")
         print(f"{'='*80}")
 
-        from glob import glob
+        # An unchanged HEAD has the same tags, reuse the index saved by an earlier run
+        index_file = self._tag_index_file()
+        if index_file and os.path.isfile(index_file):
+            index = json_loads(Path(index_file).read_bytes())
+            tag_to_tests = index['tag_to_tests']
+            all_tags = set(index['all_tags'])
+            print(f"   Loaded tag index from cache: {index_file}")
+            print(f"✅ Found {len(all_tags)} unique tags with {sum(len(tests) for tests in tag_to_tests.values())} total test cases")
+            print(f"   Tags: {', '.join(sorted(all_tags))}")
+            return tag_to_tests
 
         tag_to_tests = {}
         all_tags = set()
 
         # Find all test files
-        for pattern in self.repo_config['test_patterns']:
-            search_pattern = os.path.join(self.repo_path, pattern)
-            test_files = glob(search_pattern, recursive=True)
-
-            for test_file in test_files:
-                self._extract_tags_from_file(test_file, tag_to_tests, all_tags)
+        test_files = self._find_test_files()
+
+        # Bucket the files by kind so each worker chunk runs a single parser
+        by_kind = {suffix: [] for suffix in _TEST_FILE_PARSERS}
+        for file_path in test_files:
+            for suffix, files in by_kind.items():
+                if file_path.endswith(suffix):
+                    files.append(file_path)
+                    break
+
+        # Reading and regex scanning the files is independent per file, spread it over the cores.
+        # map() keeps the file order within a bucket, so the merged lists come out as with a serial scan.
+        with ProcessPoolExecutor() as executor:
+            for suffix, files in by_kind.items():
+                if not files:
+                    continue
+                parser = _TEST_FILE_PARSERS[suffix]
+                results = executor.map(_parse_test_file, repeat(parser), files, repeat(self.repo_path), chunksize=32)
+                for file_tag_to_tests, file_tags in results:
+                    for tag, tests in file_tag_to_tests.items():
+                        tag_to_tests.setdefault(tag, []).extend(tests)
+                    all_tags.update(file_tags)
 
         print(f"✅ Found {len(all_tags)} unique tags with {sum(len(tests) for tests in tag_to_tests.values())} total test cases")
         print(f"   Tags: {', '.join(sorted(all_tags))}")
 
+        if index_file:
+            self._save_tag_index(index_file, tag_to_tests, all_tags)
+
         return tag_to_tests
 
-    def _extract_tags_from_file(self, file_path: str, tag_to_tests: Dict, all_tags: Set):
-        """Extract test tags and cases from a single file (supports Ginkgo, Cypress, and Cypress spec.js)"""
-        rel_path = os.path.relpath(file_path, self.repo_path)
+    def _tag_index_file(self) -> Optional[str]:
+        """Path of the cached tag index for the checked out HEAD, None when the clone is not cached"""
+        if not self.use_cache:
+            return None
+        sha = self._head_sha()
+        if not sha:
+            return None
+        return os.path.join(self.work_dir, f'tags-v{TAG_INDEX_VERSION}-{sha}.json')
 
+    def _head_sha(self) -> Optional[str]:
+        """
+        Commit sha of HEAD, read from the .git directory without starting a git process.
+        Falls back to 'git rev-parse HEAD' for layouts not handled here.
+        """
+        git_dir = os.path.join(self.repo_path, '.git')
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # Detect file type
-            is_cypress = file_path.endswith('.cy.js')
-            is_spec = file_path.endswith('.spec.js')
-            is_ginkgo = file_path.endswith('_test.go')
-
-            if is_spec:
-                # Search component format: describe('...', { tags: tags.env }, ...)
-                # Tags mapping for search component
-                tag_mappings = {
-                    'tags.env': ['CANARY', 'ROSA'],
-                    'tags.modes': ['BVT', 'SVT'],
-                    'tags.required': ['REQUIRED'],
-                }
+            with open(os.path.join(git_dir, 'HEAD'), 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+            if not head.startswith('ref: '):
+                return head
+            ref = head[len('ref: '):]
+            ref_file = os.path.join(git_dir, ref)
+            if os.path.isfile(ref_file):
+                with open(ref_file, 'r', encoding='utf-8') as f:
+                    return f.read().strip()
+            with open(os.path.join(git_dir, 'packed-refs'), 'r', encoding='utf-8') as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(' ')
+                    if name == ref:
+                        return sha
+        except OSError:
+            pass
 
-                # Find all describe blocks with tags
-                describe_pattern = r'describe\s*\(\s*["\']([^"\']+)["\']\s*,\s*\{\s*tags:\s*(tags\.\w+)\s*\}'
-                describe_matches = re.finditer(describe_pattern, content)
-
-                for describe_match in describe_matches:
-                    suite_name = describe_match.group(1)
-                    tag_ref = describe_match.group(2)
-
-                    # Map tag reference to actual tags
-                    labels = tag_mappings.get(tag_ref, [])
-                    for label in labels:
-                        all_tags.add(label)
-
-                    # Extract it() test cases
-                    it_pattern = r"it\s*\(\s*['\"]([^'\"]*(?:RHACM4K|P\d|Sev\d)[^'\"]*)['\"]"
-                    it_matches = re.finditer(it_pattern, content, re.IGNORECASE)
-
-                    for match in it_matches:
-                        test_name = match.group(1)
-                        test_info = {
-                            'name': test_name,
-                            'suite': suite_name,
-                            'file': rel_path,
-                            'tags': labels,
-                        }
-
-                        # Add to each tag's test list
-                        for tag in labels:
-                            if tag not in tag_to_tests:
-                                tag_to_tests[tag] = []
-                            tag_to_tests[tag].append(test_info)
-
-            elif is_cypress:
-                # Cypress format:
-                # describe('test name', { tags: ['@tag1', '@tag2'] }, () => {
-                #   it('RHACM4K-xxxxx: test description', { tags: ['@xxxxx'] }, () => {...})
-                # })
-
-                # Extract describe block tags
-                describe_pattern = r'describe\s*\(\s*["\']([^"\']+)["\']\s*,\s*\{\s*tags:\s*\[([^\]]+)\]\s*\}'
-                describe_match = re.search(describe_pattern, content)
-
-                if not describe_match:
-                    return
-
-                suite_name = describe_match.group(1)
-                tags_str = describe_match.group(2)
-
-                # Parse describe-level tags (remove @ prefix and quotes)
-                describe_tags = []
-                for tag in re.findall(r"['\"]([^'\"]+)['\"]", tags_str):
-                    tag_clean = tag.lstrip('@')
-                    if tag_clean:
-                        describe_tags.append(tag_clean)
-                        all_tags.add(tag_clean)
-
-                # Extract it() test cases with their individual tags
-                # Pattern: it('RHACM4K-12345: test description', { tags: ['@12345', '@other'] }, () => {...})
-                # or: it('RHACM4K-12345: test description', () => {...})
-                it_pattern = r"it\s*\(\s*['\"]([^'\"]*RHACM4K-(\d+)[^'\"]*)['\"](?:\s*,\s*\{\s*tags:\s*\[([^\]]+)\]\s*\})?"
-                it_matches = re.finditer(it_pattern, content, re.IGNORECASE)
-
-                for match in it_matches:
-                    test_name = match.group(1)
-                    test_number = match.group(2)  # Extract the number part (e.g., "12345")
-                    it_tags_str = match.group(3)  # Optional it-level tags
-
-                    # Parse it-level tags
-                    it_tags = []
-                    if it_tags_str:
-                        for tag in re.findall(r"['\"]([^'\"]+)['\"]", it_tags_str):
-                            tag_clean = tag.lstrip('@')
-                            if tag_clean:
-                                it_tags.append(tag_clean)
-                                all_tags.add(tag_clean)
-
-                    # Combine describe tags and it tags
-                    # Filter out generic tags like 'non-ui' and 'uitest'
-                    combined_tags = []
-                    for tag in describe_tags + it_tags:
-                        if tag not in ['non-ui', 'uitest', 'ui']:
-                            combined_tags.append(tag)
-
-                    # Always add the test case number as a tag (without @ prefix)
-                    if test_number and test_number not in combined_tags:
-                        combined_tags.append(test_number)
-                        all_tags.add(test_number)
-
-                    test_info = {
-                        'name': test_name,
-                        'suite': suite_name,
-                        'file': rel_path,
-                        'tags': combined_tags,
-                    }
-
-                    # Add to each tag's test list
-                    for tag in combined_tags:
-                        if tag not in tag_to_tests:
-                            tag_to_tests[tag] = []
-                        tag_to_tests[tag].append(test_info)
-
-            elif is_ginkgo:
-                # Ginkgo format: ginkgo.Describe("suite name", ginkgo.Label("tag1", "tag2"), ...)
-                describe_pattern = r'ginkgo\.Describe\("([^"]+)",\s*ginkgo\.Label\(([^)]+)\)'
-                describe_match = re.search(describe_pattern, content)
-
-                if not describe_match:
-                    return
-
-                suite_name = describe_match.group(1)
-                labels_str = describe_match.group(2)
-
-                # Parse Ginkgo labels
-                labels = []
-                for label in labels_str.split(','):
-                    label = label.strip().strip('"').strip("'")
-                    if label:
-                        labels.append(label)
-                        all_tags.add(label)
-
-                # Extract It() test cases within this suite
-                # Pattern: It("RHACM4K-xxxxx: test description", ...)
-                it_pattern = r'It\("(RHACM4K-\d+:[^"]+)"'
-                it_matches = re.finditer(it_pattern, content)
-
-                for match in it_matches:
-                    test_name = match.group(1)
-                    test_info = {
-                        'name': test_name,
-                        'suite': suite_name,
-                        'file': rel_path,
-                        'tags': labels,
-                    }
-
-                    # Add to each tag's test list
-                    for tag in labels:
-                        if tag not in tag_to_tests:
-                            tag_to_tests[tag] = []
-                        tag_to_tests[tag].append(test_info)
-
-        except Exception as e:
-            print(f"⚠️  Error reading {rel_path}: {e}")
+        try:
+            return subprocess.run(['git', '-C', self.repo_path, 'rev-parse', 'HEAD'],
+                                  check=True, capture_output=True, text=True).stdout.strip()
+        except subprocess.CalledProcessError:
+            return None
+
+    def _save_tag_index(self, index_file: str, tag_to_tests: Dict[str, List[Dict]], all_tags: Set[str]):
+        """Write the tag index for the current HEAD and drop the ones of older commits"""
+        for old_index in Path(self.work_dir).glob('tags-*.json'):
+            old_index.unlink()
+        Path(index_file).write_bytes(json_dumps_bytes({'all_tags': sorted(all_tags), 'tag_to_tests': tag_to_tests}))
 
     def cleanup(self):
-        """Clean up cloned repository"""
+        """Clean up cloned repository (a cached clone is kept for the next run)"""
+        if self.use_cache:
+            return
         if self.work_dir and os.path.exists(self.work_dir):
             shutil.rmtree(self.work_dir, ignore_errors=True)
             print(f"🗑️  Cleaned up: {self.work_dir}")
@@ -573,9 +976,23 @@ class TestRepository:
 class TagBasedSelector:
     """Selects tests based on file-to-tag mapping with priority levels"""
 
-    def __init__(self, component: str):
+    def __init__(self, component: str, verbose: bool = True):
         self.component = component
         self.mapping_rules = FILE_TO_TAG_MAPPINGS.get(component, {})
+        self.compiled_rules = _COMPILED_MAPPINGS.get(component, {})
+        # Per-file and per-tag lines are collected here and written in one go, or dropped when not verbose
+        self.verbose = verbose
+        self._log_buffer: List[str] = []
+
+    def _log(self, line: str):
+        if self.verbose:
+            self._log_buffer.append(line)
+
+    def _flush_log(self):
+        if self._log_buffer:
+            self._log_buffer.append('')
+            sys.stdout.write('\n'.join(self._log_buffer))
+            self._log_buffer.clear()
 
     def is_docs_only_change(self, changed_files: List[Dict]) -> bool:
         """Check if all changes are documentation only"""
@@ -591,14 +1008,11 @@ class TagBasedSelector:
 
     def is_critical_change(self, changed_files: List[Dict]) -> bool:
         """Check if changes are in critical paths"""
-        critical_patterns = self.mapping_rules.get('critical_patterns', [])
+        critical_regex = self.compiled_rules.get('critical_regex')
+        if critical_regex is None:
+            return False
 
-        for file_info in changed_files:
-            filename = file_info['filename']
-            for pattern in critical_patterns:
-                if re.search(pattern, filename):
-                    return True
-        return False
+        return any(critical_regex.search(file_info['filename']) for file_info in changed_files)
 
     def map_files_to_tags(self, changed_files: List[Dict]) -> Dict:
         """
@@ -627,22 +1041,30 @@ class TagBasedSelector:
             print(f"⚠️  Critical path changes detected - will run comprehensive tests")
 
         matched_tags = set()
-        path_to_tags = self.mapping_rules.get('path_to_tags', {})
+        path_literals = self.compiled_rules.get('path_literals', [])
+        path_regex = self.compiled_rules.get('path_regex')
+        path_group_tags = self.compiled_rules.get('path_group_tags', [])
 
         for file_info in changed_files:
             filename = file_info['filename']
             file_tags = set()
 
-            # Match file path against mapping rules
-            for pattern, tags in path_to_tags.items():
-                if re.search(pattern, filename):
+            # Fixed-string rules first, then the remaining rules in one regex pass
+            for kind, text, tags in path_literals:
+                if filename.endswith(text) if kind == 'suffix' else text in filename:
                     file_tags.update(tags)
+            if path_regex is not None:
+                match = path_regex.match(filename)
+                for group, tags in path_group_tags:
+                    if match.group(group) is not None:
+                        file_tags.update(tags)
 
             if file_tags:
-                matched_tags.update(file_tags)
-                print(f"   {filename} → {', '.join(sorted(file_tags))}")
+                matched_tags |= file_tags
+                self._log(f"   {filename} → {', '.join(sorted(file_tags))}")
             else:
-                print(f"   {filename} → [no tags matched]")
+                self._log(f"   {filename} → [no tags matched]")
+        self._flush_log()
 
         # IMPORTANT: Never use 'e2e' tag as it contains all test cases
         # Remove e2e tag if accidentally added
@@ -678,54 +1100,57 @@ class TagBasedSelector:
         print(f"📋 Selecting tests by tags...")
         print(f"{'='*80}")
 
-        must_run = []
-        should_run = []
-        test_names_seen = set()
+        # Keyed by test name: O(1) duplicate lookup and promotion, insertion order is the selection order
+        must_run = {}
+        should_run = {}
+        name_to_test = {}
 
         for tag in sorted(tags):
             if tag in tag_to_tests:
                 tests = tag_to_tests[tag]
                 tag_status = "🔥 [CRITICAL]" if is_critical else ""
-                print(f"   Tag '{tag}': {len(tests)} test(s) {tag_status}")
+                self._log(f"   Tag '{tag}': {len(tests)} test(s) {tag_status}")
 
                 for test in tests:
                     # Avoid duplicates
-                    if test['name'] not in test_names_seen:
-                        test_names_seen.add(test['name'])
+                    name = test['name']
+                    existing_test = name_to_test.get(name)
+                    if existing_test is None:
                         test_copy = test.copy()
+                        name_to_test[name] = test_copy
                         test_copy['matched_tags'] = [tag]
                         test_copy['match_score'] = 0
+                        # Carry the RHACM4K number with the selection so reports never re-regex it
+                        _test_number(test_copy)
 
                         # Determine priority
                         if is_critical:
                             # Critical changes = must_run
                             test_copy['priority'] = 'must_run'
                             test_copy['match_score'] = 10
-                            must_run.append(test_copy)
+                            must_run[name] = test_copy
                         elif tag in tags:
                             # Direct tag match = must_run
                             test_copy['priority'] = 'must_run'
                             test_copy['match_score'] = 3
-                            must_run.append(test_copy)
+                            must_run[name] = test_copy
                         else:
                             # Indirect match = should_run
                             test_copy['priority'] = 'should_run'
                             test_copy['match_score'] = 1
-                            should_run.append(test_copy)
+                            should_run[name] = test_copy
                     else:
                         # Test already selected, update matched_tags and score
-                        for existing_test in must_run + should_run:
-                            if existing_test['name'] == test['name']:
-                                existing_test['matched_tags'].append(tag)
-                                existing_test['match_score'] += 1
-                                # Promote to must_run if score is high enough
-                                if existing_test['match_score'] >= 2 and existing_test in should_run:
-                                    should_run.remove(existing_test)
-                                    existing_test['priority'] = 'must_run'
-                                    must_run.append(existing_test)
-                                break
+                        existing_test['matched_tags'].append(tag)
+                        existing_test['match_score'] += 1
+                        # Promote to must_run if score is high enough
+                        if existing_test['match_score'] >= 2 and name in should_run:
+                            del should_run[name]
+                            existing_test['priority'] = 'must_run'
+                            must_run[name] = existing_test
             else:
-                print(f"   Tag '{tag}': 0 test(s) [tag not found]")
+                self._log(f"   Tag '{tag}': 0 test(s) [tag not found]")
+        self._flush_log()
 
         print(f"\n✅ Selected tests:")
         print(f"   Must run: {len(must_run)} tests")
@@ -733,8 +1158,8 @@ class TagBasedSelector:
         print(f"   Total: {len(must_run) + len(should_run)} unique test cases")
 
         return {
-            'must_run': must_run,
-            'should_run': should_run,
+            'must_run': list(must_run.values()),
+            'should_run': list(should_run.values()),
         }
 
 
@@ -799,9 +1224,99 @@ class JenkinsJobTrigger:
             raise
 
 
+# Text from GitHub and the test repository is escaped with this table before it goes into a report
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+# Report stylesheets, plain strings written as-is between the head and body of each report
+_SINGLE_PR_REPORT_CSS = """    <style>
+        body { font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #f0f2f5; }
+        .container { max-width: 1400px; margin: 0 auto; }
+        h1 { color: #1a1a1a; margin-bottom: 10px; }
+        .subtitle { color: #666; margin-bottom: 30px; }
+        .pr-card { background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        .pr-card h2 { margin-top: 0; color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        .pr-meta { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-top: 15px; }
+        .pr-meta-item { padding: 10px; background: #f8f9fa; border-radius: 5px; }
+        .pr-meta-label { font-weight: bold; color: #555; font-size: 0.9em; }
+        .pr-meta-value { color: #333; margin-top: 5px; }
+
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+        .stat-card { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 10px; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }
+        .stat-card h3 { margin: 0 0 10px 0; font-size: 0.9em; opacity: 0.9; font-weight: normal; }
+        .stat-card .value { font-size: 2.5em; font-weight: bold; margin: 0; }
+
+        .tag-section { background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        .tag-header { display: flex; align-items: center; margin-bottom: 15px; padding-bottom: 10px; border-bottom: 2px solid #e9ecef; }
+        .tag-badge { display: inline-block; background: #3498db; color: white; padding: 8px 16px; border-radius: 20px; font-weight: bold; margin-right: 15px; }
+        .tag-count { color: #666; }
+
+        .test-list { margin-top: 15px; }
+        .test-item { padding: 12px; margin-bottom: 8px; background: #f8f9fa; border-left: 4px solid #3498db; border-radius: 4px; font-family: 'Courier New', monospace; font-size: 0.9em; }
+        .test-item:hover { background: #e9ecef; }
+
+        .efficiency { background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); color: white; padding: 25px; border-radius: 10px; margin: 20px 0; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }
+        .efficiency h3 { margin: 0 0 10px 0; }
+        .efficiency .big { font-size: 2.5em; font-weight: bold; }
+
+        .next-steps { background: #fff3cd; border: 1px solid #ffc107; padding: 20px; border-radius: 8px; margin-top: 20px; }
+        .next-steps h3 { margin-top: 0; color: #856404; }
+        .next-steps ol { margin: 10px 0; padding-left: 20px; }
+        .next-steps li { margin: 8px 0; color: #856404; }
+    </style>
+"""
+_BATCH_REPORT_CSS = """    <style>
+        body { font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #f0f2f5; }
+        .container { max-width: 1400px; margin: 0 auto; }
+        h1 { color: #1a1a1a; margin-bottom: 10px; }
+        .subtitle { color: #666; margin-bottom: 30px; }
+
+        .summary-card { background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        .summary-card h2 { margin-top: 0; color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+
+        .pr-table { width: 100%; border-collapse: collapse; margin-top: 15px; }
+        .pr-table th { background: #f8f9fa; padding: 12px; text-align: left; border-bottom: 2px solid #dee2e6; font-weight: 600; }
+        .pr-table td { padding: 12px; border-bottom: 1px solid #dee2e6; }
+        .pr-table tr:hover { background: #f8f9fa; }
+        .pr-link { color: #3498db; text-decoration: none; }
+        .pr-link:hover { text-decoration: underline; }
+        .tag-list { font-size: 0.85em; color: #666; }
+
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+        .stat-card { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 10px; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }
+        .stat-card h3 { margin: 0 0 10px 0; font-size: 0.9em; opacity: 0.9; font-weight: normal; }
+        .stat-card .value { font-size: 2.5em; font-weight: bold; margin: 0; }
+
+        .tag-section { background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        .tag-header { display: flex; align-items: center; margin-bottom: 15px; padding-bottom: 10px; border-bottom: 2px solid #e9ecef; }
+        .tag-badge { display: inline-block; background: #3498db; color: white; padding: 8px 16px; border-radius: 20px; font-weight: bold; margin-right: 15px; }
+        .tag-count { color: #666; }
+
+        .test-list { margin-top: 15px; }
+        .test-item { padding: 12px; margin-bottom: 8px; background: #f8f9fa; border-left: 4px solid #3498db; border-radius: 4px; font-family: 'Courier New', monospace; font-size: 0.9em; }
+        .test-item:hover { background: #e9ecef; }
+
+        .efficiency { background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); color: white; padding: 25px; border-radius: 10px; margin: 20px 0; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }
+        .efficiency h3 { margin: 0 0 10px 0; }
+        .efficiency .big { font-size: 2.5em; font-weight: bold; }
+
+        .next-steps { background: #fff3cd; border: 1px solid #ffc107; padding: 20px; border-radius: 8px; margin-top: 20px; }
+        .next-steps h3 { margin-top: 0; color: #856404; }
+        .next-steps ol { margin: 10px 0; padding-left: 20px; }
+        .next-steps li { margin: 8px 0; color: #856404; }
+    </style>
+"""
+
+
 class ReportGenerator:
     """Generates HTML reports"""
 
+    # Prebuilt fragments for the per-test rows and tag sections of the streamed reports
+    _TEST_ITEM_ROW = '                <div class="test-item">✓ {name}</div>\n'
+    _TAG_SECTION_END = """
+            </div>
+        </div>
+"""
+
     def _optimize_tags_for_report(self, selected_tests: List[Dict], component: str,
                                   min_tests_per_tag: int = 5) -> str:
         """
@@ -820,161 +1335,105 @@ class ReportGenerator:
 
         # For GRC component: Analyze functional tags vs test numbers
         if component == 'grc':
-            # Build mapping: functional_tag -> set of test numbers
+            # Build mapping: functional_tag -> bitmask of the test numbers it covers.
+            # Every distinct test number gets one bit, so coverage math is int & | and bit_count().
             functional_tag_coverage = {}
-            test_to_functional_tags = {}  # test_number -> [functional_tags]
+            test_bits = {}  # test_number -> its bit
+            # With fewer tests than min_tests_per_tag no functional tag can ever qualify
+            track_functional = len(selected_tests) >= min_tests_per_tag
 
             for test in selected_tests:
                 # Extract test number
-                match = re.search(r'RHACM4K-(\d+)', test['name'])
-                if not match:
+                test_number = _test_number(test)
+                if not test_number:
                     continue
 
-                test_number = match.group(1)
-
-                # Get all tags for this test (both functional and test number)
-                all_tags = test.get('tags', [])
-
-                # Separate functional tags from test numbers
-                functional_tags = [t for t in all_tags if not t.isdigit()]
+                bit = test_bits.get(test_number)
+                if bit is None:
+                    bit = test_bits[test_number] = 1 << len(test_bits)
 
-                # Record functional tags for this test number
-                test_to_functional_tags[test_number] = functional_tags
-
-                # Track which tests each functional tag covers
-                for func_tag in functional_tags:
-                    if func_tag not in functional_tag_coverage:
-                        functional_tag_coverage[func_tag] = set()
-                    functional_tag_coverage[func_tag].add(test_number)
+                if not track_functional:
+                    continue
+                # Track which tests each functional tag covers (tags without digits only)
+                for func_tag in test.get('tags', ()):
+                    if not func_tag.isdigit():
+                        functional_tag_coverage[func_tag] = functional_tag_coverage.get(func_tag, 0) | bit
 
             # Find functional tags that cover enough tests
             optimized_tags = set()
-            covered_test_numbers = set()
+            covered = 0
 
-            # Sort by coverage (descending) to prioritize tags that cover more tests
-            sorted_functional_tags = sorted(
-                functional_tag_coverage.items(),
-                key=lambda x: len(x[1]),
-                reverse=True
-            )
-
-            for func_tag, test_numbers in sorted_functional_tags:
-                # Only use this functional tag if it covers enough tests
-                if len(test_numbers) >= min_tests_per_tag:
-                    # Check how many uncovered tests this tag would cover
-                    uncovered_tests = test_numbers - covered_test_numbers
-
-                    # If it covers at least min_tests_per_tag uncovered tests, use it
-                    if len(uncovered_tests) >= min_tests_per_tag:
-                        optimized_tags.add(func_tag)
-                        covered_test_numbers.update(test_numbers)
+            for func_tag, mask in _greedy_tag_cover(functional_tag_coverage, min_tests_per_tag):
+                optimized_tags.add(func_tag)
+                covered |= mask
 
             # Add individual test numbers for uncovered tests
-            all_test_numbers = set(test_to_functional_tags.keys())
-            uncovered_test_numbers = all_test_numbers - covered_test_numbers
-
-            for test_num in uncovered_test_numbers:
-                optimized_tags.add(test_num)
+            for test_num, bit in test_bits.items():
+                if not covered & bit:
+                    optimized_tags.add(test_num)
 
             # Format tags for display (with @ prefix)
-            jenkins_tags = []
-            for tag in sorted(optimized_tags, key=lambda x: (x.isdigit(), int(x) if x.isdigit() else 0, x)):
-                jenkins_tags.append(f'@{tag}')
-
-            return ' || '.join(jenkins_tags)
+            if not optimized_tags:
+                return ''
+            return '@' + ' || @'.join(_sorted_display_tags(optimized_tags))
 
         else:
             # For other components: Use tags as-is
             tags = set()
             for test in selected_tests:
-                tags.update(test.get('matched_tags', []))
+                tags.update(test.get('matched_tags', ()))
             return ' || '.join(sorted(tags))
 
     def generate_single_pr_report(self, pr_info: Dict, selected_tags: Set[str],
                                    selected_tests: Dict, total_tags: int,
                                    output_file: str):
         """Generate tag-based report for single PR with priority levels"""
+        # One join and one UTF-8 encode for the whole page, written as bytes
+        html = ''.join(self._iter_single_pr_report(pr_info, selected_tags, selected_tests, total_tags))
+        with open(output_file, 'wb') as f:
+            f.write(html.encode('utf-8'))
+
+        print(f"📄 Report saved: {output_file}")
+
+    def _iter_single_pr_report(self, pr_info: Dict, selected_tags: Set[str],
+                               selected_tests: Dict, total_tags: int) -> Iterator[str]:
+        """Yield the HTML of the single PR report section by section"""
 
         must_run = selected_tests.get('must_run', [])
         should_run = selected_tests.get('should_run', [])
-        all_tests = must_run + should_run
+        total_tests = len(must_run) + len(should_run)
 
         # For GRC component: Extract test case numbers and group by them
         # For other components: Group by functional tags
         component = pr_info.get('component', '')
 
         if component == 'grc':
-            # Extract test case numbers from test names
-            test_case_numbers = set()
-            for test in all_tests:
-                # Extract number from test name (e.g., "RHACM4K-3471: ..." → "3471")
-                match = re.search(r'RHACM4K-(\d+)', test['name'])
-                if match:
-                    test_case_numbers.add(match.group(1))
-
-            # Group tests by their test case numbers
-            tag_groups = {}
-            for test in all_tests:
-                match = re.search(r'RHACM4K-(\d+)', test['name'])
-                if match:
-                    test_num = match.group(1)
-                    if test_num not in tag_groups:
-                        tag_groups[test_num] = []
+            # Group tests by the test case numbers in their names, the numbers seen are the group keys
+            tag_groups = defaultdict(list)
+            for test in chain(must_run, should_run):
+                test_num = _test_number(test)
+                if test_num:
                     tag_groups[test_num].append(test)
+            test_case_numbers = set(tag_groups)
 
             # Update selected_tags to use test numbers for display
             display_tags = test_case_numbers
         else:
             # Group tests by tags (original behavior)
-            tag_groups = {}
-            for test in all_tests:
-                for tag in test.get('matched_tags', []):
-                    if tag not in tag_groups:
-                        tag_groups[tag] = []
+            tag_groups = defaultdict(list)
+            for test in chain(must_run, should_run):
+                for tag in test.get('matched_tags') or ():
                     tag_groups[tag].append(test)
             display_tags = selected_tags
 
-        html = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>PR #{pr_info['pr_number']} Tag-Based Test Selection</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #f0f2f5; }}
-        .container {{ max-width: 1400px; margin: 0 auto; }}
-        h1 {{ color: #1a1a1a; margin-bottom: 10px; }}
-        .subtitle {{ color: #666; margin-bottom: 30px; }}
-        .pr-card {{ background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }}
-        .pr-card h2 {{ margin-top: 0; color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}
-        .pr-meta {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px; margin-top: 15px; }}
-        .pr-meta-item {{ padding: 10px; background: #f8f9fa; border-radius: 5px; }}
-        .pr-meta-label {{ font-weight: bold; color: #555; font-size: 0.9em; }}
-        .pr-meta-value {{ color: #333; margin-top: 5px; }}
-
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .stat-card {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 10px; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }}
-        .stat-card h3 {{ margin: 0 0 10px 0; font-size: 0.9em; opacity: 0.9; font-weight: normal; }}
-        .stat-card .value {{ font-size: 2.5em; font-weight: bold; margin: 0; }}
-
-        .tag-section {{ background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }}
-        .tag-header {{ display: flex; align-items: center; margin-bottom: 15px; padding-bottom: 10px; border-bottom: 2px solid #e9ecef; }}
-        .tag-badge {{ display: inline-block; background: #3498db; color: white; padding: 8px 16px; border-radius: 20px; font-weight: bold; margin-right: 15px; }}
-        .tag-count {{ color: #666; }}
-
-        .test-list {{ margin-top: 15px; }}
-        .test-item {{ padding: 12px; margin-bottom: 8px; background: #f8f9fa; border-left: 4px solid #3498db; border-radius: 4px; font-family: 'Courier New', monospace; font-size: 0.9em; }}
-        .test-item:hover {{ background: #e9ecef; }}
-
-        .efficiency {{ background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); color: white; padding: 25px; border-radius: 10px; margin: 20px 0; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }}
-        .efficiency h3 {{ margin: 0 0 10px 0; }}
-        .efficiency .big {{ font-size: 2.5em; font-weight: bold; }}
-
-        .next-steps {{ background: #fff3cd; border: 1px solid #ffc107; padding: 20px; border-radius: 8px; margin-top: 20px; }}
-        .next-steps h3 {{ margin-top: 0; color: #856404; }}
-        .next-steps ol {{ margin: 10px 0; padding-left: 20px; }}
-        .next-steps li {{ margin: 8px 0; color: #856404; }}
-    </style>
-</head>
+"""
+        yield _SINGLE_PR_REPORT_CSS
+        yield f"""</head>
 <body>
     <div class="container">
         <h1>🎯 Tag-Based Test Selection Report</h1>
@@ -985,15 +1444,15 @@ class ReportGenerator:
             <div class="pr-meta">
                 <div class="pr-meta-item">
                     <div class="pr-meta-label">PR Number</div>
-                    <div class="pr-meta-value"><a href="{pr_info['url']}" target="_blank">#{pr_info['pr_number']}</a></div>
+                    <div class="pr-meta-value"><a href="{pr_info['url'].translate(_HTML_ESCAPE)}" target="_blank">#{pr_info['pr_number']}</a></div>
                 </div>
                 <div class="pr-meta-item">
                     <div class="pr-meta-label">Title</div>
-                    <div class="pr-meta-value">{pr_info['title']}</div>
+                    <div class="pr-meta-value">{pr_info['title'].translate(_HTML_ESCAPE)}</div>
                 </div>
                 <div class="pr-meta-item">
                     <div class="pr-meta-label">Repository</div>
-                    <div class="pr-meta-value">{pr_info['repo']}</div>
+                    <div class="pr-meta-value">{pr_info['repo'].translate(_HTML_ESCAPE)}</div>
                 </div>
                 <div class="pr-meta-item">
                     <div class="pr-meta-label">Component</div>
@@ -1001,7 +1460,7 @@ class ReportGenerator:
                 </div>
                 <div class="pr-meta-item">
                     <div class="pr-meta-label">Author</div>
-                    <div class="pr-meta-value">{pr_info['author']}</div>
+                    <div class="pr-meta-value">{pr_info['author'].translate(_HTML_ESCAPE)}</div>
                 </div>
                 <div class="pr-meta-item">
                     <div class="pr-meta-label">Files Changed</div>
@@ -1021,7 +1480,7 @@ class ReportGenerator:
             </div>
             <div class="stat-card">
                 <h3>Selected Tests</h3>
-                <div class="value">{len(all_tests)}</div>
+                <div class="value">{total_tests}</div>
             </div>
             <div class="stat-card">
                 <h3>Tag Coverage</h3>
@@ -1040,41 +1499,39 @@ class ReportGenerator:
 
         # Render each tag group (sorted numerically for GRC, alphabetically for others)
         if component == 'grc':
-            sorted_tags = sorted(tag_groups.keys(), key=lambda x: int(x) if x.isdigit() else 0)
+            # GRC groups are keyed by RHACM4K numbers, which are always digits
+            sorted_tags = sorted(tag_groups.keys(), key=int)
         else:
             sorted_tags = sorted(tag_groups.keys())
 
         for tag in sorted_tags:
             tests = tag_groups[tag]
             tag_label = f"@{tag}" if component == 'grc' else tag
-            html += f"""
+            yield f"""
         <div class="tag-section">
             <div class="tag-header">
-                <span class="tag-badge">{tag_label}</span>
+                <span class="tag-badge">{tag_label.translate(_HTML_ESCAPE)}</span>
                 <span class="tag-count">{len(tests)} test case(s)</span>
             </div>
             <div class="test-list">
 """
-            for test in tests:
-                html += f'                <div class="test-item">✓ {test["name"]}</div>\n'
+            yield from (self._TEST_ITEM_ROW.format(name=test['name'].translate(_HTML_ESCAPE)) for test in tests)
 
-            html += """
-            </div>
-        </div>
-"""
+            yield self._TAG_SECTION_END
 
         # Generate Jenkins tags format
         if component == 'grc':
-            jenkins_tags = ' || '.join([f'@{t}' for t in sorted(display_tags, key=lambda x: int(x) if x.isdigit() else 0)])
+            # display_tags are the group keys here, already sorted above
+            jenkins_tags = ' || '.join([f'@{t}' for t in sorted_tags])
         else:
             jenkins_tags = ' || '.join(sorted(display_tags))
 
-        html += f"""
+        yield f"""
         <div class="next-steps">
             <h3>📝 Next Steps</h3>
             <ol>
-                <li>Review the selected {len(all_tests)} test cases above</li>
-                <li>Trigger Jenkins job with selected tags: <code>{jenkins_tags}</code></li>
+                <li>Review the selected {total_tests} test cases above</li>
+                <li>Trigger Jenkins job with selected tags: <code>{jenkins_tags.translate(_HTML_ESCAPE)}</code></li>
                 <li>Monitor test execution and results</li>
                 <li>Update test selection rules if needed</li>
             </ol>
@@ -1088,43 +1545,38 @@ class ReportGenerator:
 </html>
 """
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        print(f"📄 Report saved: {output_file}")
-
     def generate_batch_report(self, prs_info: List[Dict], all_selected_tags: Set[str],
                               all_selected_tests: List[Dict], total_tags: int,
                               output_file: str, component: str = ''):
         """Generate batch report for multiple PRs"""
+        html = ''.join(self._iter_batch_report(prs_info, all_selected_tags, all_selected_tests,
+                                               total_tags, component))
+        with open(output_file, 'wb') as f:
+            f.write(html.encode('utf-8'))
+
+        print(f"📄 Report saved: {output_file}")
+
+    def _iter_batch_report(self, prs_info: List[Dict], all_selected_tags: Set[str],
+                           all_selected_tests: List[Dict], total_tags: int,
+                           component: str = '') -> Iterator[str]:
+        """Yield the HTML of the batch report section by section"""
 
         # For GRC component: Extract test case numbers
         if component == 'grc':
-            # Extract test case numbers from test names
-            test_case_numbers = set()
+            # Group tests by the test case numbers in their names, the numbers seen are the group keys
+            tag_groups = defaultdict(list)
             for test in all_selected_tests:
-                match = re.search(r'RHACM4K-(\d+)', test['name'])
-                if match:
-                    test_case_numbers.add(match.group(1))
-
-            # Group tests by their test case numbers
-            tag_groups = {}
-            for test in all_selected_tests:
-                match = re.search(r'RHACM4K-(\d+)', test['name'])
-                if match:
-                    test_num = match.group(1)
-                    if test_num not in tag_groups:
-                        tag_groups[test_num] = []
+                test_num = _test_number(test)
+                if test_num:
                     tag_groups[test_num].append(test)
+            test_case_numbers = set(tag_groups)
 
             display_tags = test_case_numbers
         else:
             # Group tests by tag (original behavior)
-            tag_groups = {}
+            tag_groups = defaultdict(list)
             for test in all_selected_tests:
-                for tag in test.get('matched_tags', []):
-                    if tag not in tag_groups:
-                        tag_groups[tag] = []
+                for tag in test.get('matched_tags') or ():
                     tag_groups[tag].append(test)
             display_tags = all_selected_tags
 
@@ -1133,13 +1585,10 @@ class ReportGenerator:
         for pr_info in prs_info:
             # For GRC, extract test numbers from the PR's selected tests
             if component == 'grc':
-                pr_test_numbers = set()
-                for test_group in pr_info.get('selected_tests', {}).values():
-                    for test in test_group:
-                        match = re.search(r'RHACM4K-(\d+)', test['name'])
-                        if match:
-                            pr_test_numbers.add(match.group(1))
-                pr_tags = pr_test_numbers
+                pr_tags = {test_num
+                           for test_group in pr_info.get('selected_tests', {}).values()
+                           for test in test_group
+                           if (test_num := _test_number(test))}
             else:
                 pr_tags = pr_info.get('selected_tags', set())
 
@@ -1153,52 +1602,14 @@ class ReportGenerator:
                              len(pr_info.get('selected_tests', {}).get('should_run', []))
             })
 
-        html = f"""<!DOCTYPE html>
+        yield """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>Batch PR Test Selection Report</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 0; padding: 20px; background: #f0f2f5; }}
-        .container {{ max-width: 1400px; margin: 0 auto; }}
-        h1 {{ color: #1a1a1a; margin-bottom: 10px; }}
-        .subtitle {{ color: #666; margin-bottom: 30px; }}
-
-        .summary-card {{ background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }}
-        .summary-card h2 {{ margin-top: 0; color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}
-
-        .pr-table {{ width: 100%; border-collapse: collapse; margin-top: 15px; }}
-        .pr-table th {{ background: #f8f9fa; padding: 12px; text-align: left; border-bottom: 2px solid #dee2e6; font-weight: 600; }}
-        .pr-table td {{ padding: 12px; border-bottom: 1px solid #dee2e6; }}
-        .pr-table tr:hover {{ background: #f8f9fa; }}
-        .pr-link {{ color: #3498db; text-decoration: none; }}
-        .pr-link:hover {{ text-decoration: underline; }}
-        .tag-list {{ font-size: 0.85em; color: #666; }}
-
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .stat-card {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 25px; border-radius: 10px; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }}
-        .stat-card h3 {{ margin: 0 0 10px 0; font-size: 0.9em; opacity: 0.9; font-weight: normal; }}
-        .stat-card .value {{ font-size: 2.5em; font-weight: bold; margin: 0; }}
-
-        .tag-section {{ background: white; padding: 25px; margin-bottom: 20px; border-radius: 10px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }}
-        .tag-header {{ display: flex; align-items: center; margin-bottom: 15px; padding-bottom: 10px; border-bottom: 2px solid #e9ecef; }}
-        .tag-badge {{ display: inline-block; background: #3498db; color: white; padding: 8px 16px; border-radius: 20px; font-weight: bold; margin-right: 15px; }}
-        .tag-count {{ color: #666; }}
-
-        .test-list {{ margin-top: 15px; }}
-        .test-item {{ padding: 12px; margin-bottom: 8px; background: #f8f9fa; border-left: 4px solid #3498db; border-radius: 4px; font-family: 'Courier New', monospace; font-size: 0.9em; }}
-        .test-item:hover {{ background: #e9ecef; }}
-
-        .efficiency {{ background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%); color: white; padding: 25px; border-radius: 10px; margin: 20px 0; text-align: center; box-shadow: 0 4px 12px rgba(0,0,0,0.15); }}
-        .efficiency h3 {{ margin: 0 0 10px 0; }}
-        .efficiency .big {{ font-size: 2.5em; font-weight: bold; }}
-
-        .next-steps {{ background: #fff3cd; border: 1px solid #ffc107; padding: 20px; border-radius: 8px; margin-top: 20px; }}
-        .next-steps h3 {{ margin-top: 0; color: #856404; }}
-        .next-steps ol {{ margin: 10px 0; padding-left: 20px; }}
-        .next-steps li {{ margin: 8px 0; color: #856404; }}
-    </style>
-</head>
+"""
+        yield _BATCH_REPORT_CSS
+        yield f"""</head>
 <body>
     <div class="container">
         <h1>🎯 Batch PR Test Selection Report</h1>
@@ -1222,21 +1633,21 @@ class ReportGenerator:
         for pr_stat in pr_stats:
             # For GRC, add @ prefix to tag numbers
             if component == 'grc' and pr_stat['tags']:
-                tags_str = ', '.join([f"@{t}" for t in sorted(pr_stat['tags'], key=lambda x: int(x) if x.isdigit() else 0)])
+                tags_str = ', '.join([f"@{t}" for t in sorted(pr_stat['tags'], key=int)])
             else:
                 tags_str = ', '.join(sorted(pr_stat['tags'])) if pr_stat['tags'] else 'None'
 
-            html += f"""
+            yield f"""
                     <tr>
-                        <td><a href="{pr_stat['url']}" class="pr-link" target="_blank">#{pr_stat['pr_number']}</a></td>
-                        <td>{pr_stat['title']}</td>
-                        <td>{pr_stat['author']}</td>
-                        <td class="tag-list">{tags_str}</td>
+                        <td><a href="{pr_stat['url'].translate(_HTML_ESCAPE)}" class="pr-link" target="_blank">#{pr_stat['pr_number']}</a></td>
+                        <td>{pr_stat['title'].translate(_HTML_ESCAPE)}</td>
+                        <td>{pr_stat['author'].translate(_HTML_ESCAPE)}</td>
+                        <td class="tag-list">{tags_str.translate(_HTML_ESCAPE)}</td>
                         <td>{pr_stat['test_count']}</td>
                     </tr>
 """
 
-        html += f"""
+        yield f"""
                 </tbody>
             </table>
         </div>
@@ -1271,47 +1682,49 @@ class ReportGenerator:
 
         # Render each tag group (sorted numerically for GRC, alphabetically for others)
         if component == 'grc':
-            sorted_tags = sorted(tag_groups.keys(), key=lambda x: int(x) if x.isdigit() else 0)
+            # GRC groups are keyed by RHACM4K numbers, which are always digits
+            sorted_tags = sorted(tag_groups.keys(), key=int)
         else:
             sorted_tags = sorted(tag_groups.keys())
 
         for tag in sorted_tags:
             tests = tag_groups[tag]
-            # Remove duplicates
-            unique_tests = list({test['name']: test for test in tests}.values())
+            if component == 'grc':
+                # all_selected_tests is unique by name and each test joins one number group
+                unique_tests = tests
+            else:
+                # A test is listed under a tag once per match of that tag, keep the first
+                seen = set()
+                unique_tests = [test for test in tests if not (test['name'] in seen or seen.add(test['name']))]
             tag_label = f"@{tag}" if component == 'grc' else tag
 
-            html += f"""
+            yield f"""
         <div class="tag-section">
             <div class="tag-header">
-                <span class="tag-badge">{tag_label}</span>
+                <span class="tag-badge">{tag_label.translate(_HTML_ESCAPE)}</span>
                 <span class="tag-count">{len(unique_tests)} test case(s)</span>
             </div>
             <div class="test-list">
 """
-            for test in unique_tests:
-                html += f'                <div class="test-item">✓ {test["name"]}</div>\n'
+            yield from (self._TEST_ITEM_ROW.format(name=test['name'].translate(_HTML_ESCAPE)) for test in unique_tests)
 
-            html += """
-            </div>
-        </div>
-"""
+            yield self._TAG_SECTION_END
 
         # Generate optimized Jenkins tags format
         if component == 'grc' and all_selected_tests:
             # Use tag optimization for GRC
             jenkins_tags = self._optimize_tags_for_report(all_selected_tests, component)
         elif component == 'grc':
-            jenkins_tags = ' || '.join([f'@{t}' for t in sorted(display_tags, key=lambda x: int(x) if x.isdigit() else 0)])
+            jenkins_tags = ' || '.join([f'@{t}' for t in sorted(display_tags, key=int)])
         else:
             jenkins_tags = ' || '.join(sorted(display_tags))
 
-        html += f"""
+        yield f"""
         <div class="next-steps">
             <h3>📝 Next Steps</h3>
             <ol>
                 <li>Review the combined {len(all_selected_tests)} test cases from {len(prs_info)} PRs</li>
-                <li>Trigger single Jenkins job with tags: <code>{jenkins_tags}</code></li>
+                <li>Trigger single Jenkins job with tags: <code>{jenkins_tags.translate(_HTML_ESCAPE)}</code></li>
                 <li>Monitor test execution for all PRs</li>
                 <li>Report results back to each PR</li>
             </ol>
@@ -1325,18 +1738,23 @@ class ReportGenerator:
 </html>
 """
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        print(f"📄 Report saved: {output_file}")
-
 
 class UnifiedPRTestSelector:
     """Main orchestrator for single or multiple PR analysis"""
 
-    def __init__(self, github_token: str = None, jenkins_url: str = None):
+    def __init__(self, github_token: str = None, jenkins_url: str = None, use_cache: bool = True,
+                 verbose: bool = True, offline: bool = False):
         self.pr_analyzer = PRAnalyzer(github_token)
         self.jenkins_url = jenkins_url or os.getenv('JENKINS_URL')
+        self.use_cache = use_cache
+        self.verbose = verbose
+        self.offline = offline
+        self._ensured_dirs = set()  # output directories already created by this selector
+
+    def _ensure_output_dir(self, output_dir: str):
+        if output_dir not in self._ensured_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
 
     def run_single_pr(self, pr_url: str, trigger_jenkins: bool = False,
                       jenkins_job: str = None, jenkins_params: str = None,
@@ -1366,13 +1784,13 @@ class UnifiedPRTestSelector:
             raise ValueError(f"Could not detect component from repository: {pr_info['repo']}")
 
         # Step 2: Clone test repository and extract tags
-        test_repo = TestRepository(component)
+        test_repo = TestRepository(component, use_cache=self.use_cache, offline=self.offline)
         try:
             test_repo.clone()
             tag_to_tests = test_repo.extract_test_tags()
 
             # Step 3: Map changed files to tags
-            selector = TagBasedSelector(component)
+            selector = TagBasedSelector(component, verbose=self.verbose)
             tag_result = selector.map_files_to_tags(pr_info['changed_files'])
 
             # Handle docs-only changes
@@ -1395,7 +1813,7 @@ class UnifiedPRTestSelector:
 
             # Step 5: Generate report
             if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
+                self._ensure_output_dir(output_dir)
 
                 report_file = os.path.join(output_dir, 'tag_based_report.html')
                 reporter = ReportGenerator()
@@ -1448,10 +1866,10 @@ class UnifiedPRTestSelector:
         prs_info = []
         components = set()
 
-        for pr_url in pr_urls:
-            pr_info = self.pr_analyzer.get_pr_info(pr_url)
-            prs_info.append(pr_info)
-            components.add(pr_info['component'])
+        with ThreadPoolExecutor(max_workers=min(8, len(pr_urls))) as executor:
+            for pr_info in executor.map(self.pr_analyzer.get_pr_info, pr_urls):
+                prs_info.append(pr_info)
+                components.add(pr_info['component'])
 
         # Step 2: Validate same component
         if len(components) > 1:
@@ -1468,20 +1886,16 @@ class UnifiedPRTestSelector:
         print(f"\n✅ All PRs are from component: {component}")
 
         # Step 3: Clone test repository once
-        test_repo = TestRepository(component)
+        test_repo = TestRepository(component, use_cache=self.use_cache, offline=self.offline)
         try:
             test_repo.clone()
             tag_to_tests = test_repo.extract_test_tags()
 
             # Step 4: Analyze each PR and collect tags/tests
-            selector = TagBasedSelector(component)
+            selector = TagBasedSelector(component, verbose=self.verbose)
             all_selected_tags = set()
-            all_selected_tests = []
-            test_names_seen = set()
-
-            all_must_run = []
-            all_should_run = []
-            is_any_critical = False
+            # test name -> (priority, test), the first PR that selected a test decides its priority
+            merged_tests = {}
 
             for pr_info in prs_info:
                 # Map files to tags
@@ -1496,7 +1910,6 @@ class UnifiedPRTestSelector:
 
                 pr_tags = tag_result['tags']
                 is_critical = tag_result['is_critical']
-                is_any_critical = is_any_critical or is_critical
 
                 all_selected_tags.update(pr_tags)
 
@@ -1509,38 +1922,47 @@ class UnifiedPRTestSelector:
                 pr_info['is_critical'] = is_critical
 
                 # Merge into all_selected_tests (avoiding duplicates)
-                for test in pr_tests_result['must_run']:
-                    if test['name'] not in test_names_seen:
-                        test_names_seen.add(test['name'])
-                        all_must_run.append(test)
+                for priority in ('must_run', 'should_run'):
+                    for test in pr_tests_result[priority]:
+                        merged_tests.setdefault(test['name'], (priority, test))
 
-                for test in pr_tests_result['should_run']:
-                    if test['name'] not in test_names_seen:
-                        test_names_seen.add(test['name'])
-                        all_should_run.append(test)
+            all_selected_tests = ([test for priority, test in merged_tests.values() if priority == 'must_run'] +
+                                  [test for priority, test in merged_tests.values() if priority == 'should_run'])
 
-            all_selected_tests = all_must_run + all_should_run
+            # Step 5 and 6 only read the merged selection, so the report is written
+            # while the Jenkins request is in flight
+            steps = []
 
             # Step 5: Generate batch report
             if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
+                self._ensure_output_dir(output_dir)
 
                 report_file = os.path.join(output_dir, 'batch_report.html')
                 reporter = ReportGenerator()
-                reporter.generate_batch_report(
+                steps.append((
+                    reporter.generate_batch_report,
                     prs_info, all_selected_tags, all_selected_tests,
                     len(tag_to_tests), report_file, component
-                )
+                ))
 
             # Step 6: Trigger Jenkins once (optional)
             if trigger_jenkins:
                 # Use first PR info for metadata
-                self._trigger_jenkins_job(
+                steps.append((
+                    self._trigger_jenkins_job,
                     component, jenkins_job, jenkins_params,
                     all_selected_tags, prs_info[0],
-                    batch_mode=True, pr_count=len(prs_info),
-                    selected_tests=all_selected_tests
-                )
+                    True, len(prs_info), all_selected_tests
+                ))
+
+            if len(steps) > 1:
+                with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+                    futures = [executor.submit(*step) for step in steps]
+                    for future in futures:
+                        future.result()
+            else:
+                for step_fn, *step_args in steps:
+                    step_fn(*step_args)
 
             return {
                 'mode': 'batch',
@@ -1576,90 +1998,115 @@ class UnifiedPRTestSelector:
 
         # For GRC component: Analyze functional tags vs test numbers
         if component == 'grc':
-            # Build mapping: functional_tag -> set of test numbers
+            # Build mapping: functional_tag -> bitmask of the test numbers it covers.
+            # Every distinct test number gets one bit, so coverage math is int & | and bit_count().
             functional_tag_coverage = {}
-            test_to_functional_tags = {}  # test_number -> [functional_tags]
+            test_bits = {}  # test_number -> its bit
 
             for test in selected_tests:
                 # Extract test number
-                match = re.search(r'RHACM4K-(\d+)', test['name'])
-                if not match:
+                test_number = _test_number(test)
+                if not test_number:
                     continue
 
-                test_number = match.group(1)
-
-                # Get all tags for this test (both functional and test number)
-                all_tags = test.get('tags', [])
-
-                # Separate functional tags from test numbers
-                functional_tags = [t for t in all_tags if not t.isdigit()]
-
-                # Record functional tags for this test number
-                test_to_functional_tags[test_number] = functional_tags
+                bit = test_bits.get(test_number)
+                if bit is None:
+                    bit = test_bits[test_number] = 1 << len(test_bits)
 
-                # Track which tests each functional tag covers
-                for func_tag in functional_tags:
-                    if func_tag not in functional_tag_coverage:
-                        functional_tag_coverage[func_tag] = set()
-                    functional_tag_coverage[func_tag].add(test_number)
+                # Track which tests each functional tag covers (tags without digits only)
+                for func_tag in test.get('tags', ()):
+                    if not func_tag.isdigit():
+                        functional_tag_coverage[func_tag] = functional_tag_coverage.get(func_tag, 0) | bit
 
             # Find functional tags that cover enough tests
             optimized_tags = set()
-            covered_test_numbers = set()
+            covered = 0
 
-            # Sort by coverage (descending) to prioritize tags that cover more tests
-            sorted_functional_tags = sorted(
-                functional_tag_coverage.items(),
-                key=lambda x: len(x[1]),
-                reverse=True
-            )
-
-            for func_tag, test_numbers in sorted_functional_tags:
-                # Only use this functional tag if it covers enough tests
-                if len(test_numbers) >= min_tests_per_tag:
-                    # Check how many uncovered tests this tag would cover
-                    uncovered_tests = test_numbers - covered_test_numbers
+            functional_tag_count = 0
+            picked_lines = []  # printed together after the loop
 
-                    # If it covers at least min_tests_per_tag uncovered tests, use it
-                    if len(uncovered_tests) >= min_tests_per_tag:
-                        optimized_tags.add(func_tag)
-                        covered_test_numbers.update(test_numbers)
-                        print(f"   ✅ Using functional tag '{func_tag}' (covers {len(test_numbers)} tests)")
+            # Prioritize the tags that cover the most still uncovered tests
+            for func_tag, mask in _greedy_tag_cover(functional_tag_coverage, min_tests_per_tag):
+                optimized_tags.add(func_tag)
+                functional_tag_count += 1
+                covered |= mask
+                if self.verbose:
+                    picked_lines.append(f"   ✅ Using functional tag '{func_tag}' (covers {mask.bit_count()} tests)")
+            if picked_lines:
+                print('\n'.join(picked_lines))
 
             # Add individual test numbers for uncovered tests
-            all_test_numbers = set(test_to_functional_tags.keys())
-            uncovered_test_numbers = all_test_numbers - covered_test_numbers
+            all_test_count = len(test_bits)
+            if covered:
+                uncovered_test_numbers = [test_num for test_num, bit in test_bits.items() if not covered & bit]
+            else:
+                # No functional tag qualified (or none exist): every test is listed by number
+                uncovered_test_numbers = list(test_bits)
 
             if uncovered_test_numbers:
                 print(f"   📋 Using individual test numbers for {len(uncovered_test_numbers)} uncovered tests")
-                for test_num in uncovered_test_numbers:
-                    optimized_tags.add(test_num)
-
-            # Format tags for Jenkins (with @ prefix for test numbers)
-            jenkins_tags = []
-            for tag in sorted(optimized_tags, key=lambda x: (x.isdigit(), int(x) if x.isdigit() else 0, x)):
-                if tag.isdigit():
-                    jenkins_tags.append(f'@{tag}')
-                else:
-                    jenkins_tags.append(f'@{tag}')
+                optimized_tags.update(uncovered_test_numbers)
 
-            result = '||'.join(jenkins_tags)
+            # Format tags for Jenkins (with @ prefix)
+            result = '@' + '||@'.join(_sorted_display_tags(optimized_tags)) if optimized_tags else ''
 
             print(f"\n✅ Optimized tags summary:")
-            print(f"   Total tests: {len(all_test_numbers)}")
-            print(f"   Functional tags used: {len([t for t in optimized_tags if not t.isdigit()])}")
+            print(f"   Total tests: {all_test_count}")
+            print(f"   Functional tags used: {functional_tag_count}")
             print(f"   Individual test numbers: {len(uncovered_test_numbers)}")
-            print(f"   Final tag count: {len(optimized_tags)} (vs {len(all_test_numbers)} without optimization)")
+            print(f"   Final tag count: {len(optimized_tags)} (vs {all_test_count} without optimization)")
 
             return result
 
         else:
-            # For other components: Use tags as-is
+            # For other components: Use tags as-is.
+            # Sorted on purpose: set order changes between runs (str hash seeds), and the same
+            # selection must always give the same Jenkins parameter. The sort is over a few tags only.
             tags = set()
             for test in selected_tests:
-                tags.update(test.get('matched_tags', []))
+                tags.update(test.get('matched_tags', ()))
             return '||'.join(sorted(tags))
 
+    def _jenkins_tags(self, selected_tags: Set[str], selected_tests: List[Dict]) -> str:
+        """Convert tags to Ginkgo format"""
+        if not selected_tags:
+            return ''
+        # NEVER use e2e tag as default - it runs ALL tests
+        # Sorted so the parameter is deterministic, see _optimize_tags_for_jenkins
+        return '||'.join(sorted(selected_tags))
+
+    def _grc_jenkins_tags(self, selected_tags: Set[str], selected_tests: List[Dict]) -> str:
+        """Optimize tags for Jenkins (prefer common functional tags over individual test numbers)"""
+        if selected_tests:
+            return self._optimize_tags_for_jenkins(selected_tests, 'grc')
+        return self._jenkins_tags(selected_tags, selected_tests)
+
+    @staticmethod
+    def _jenkins_params(parameters: Dict, tags_ginkgo: str, pr_info: Dict,
+                        batch_mode: bool, pr_count: int):
+        """Fill TEST_TAGS:auto and add PR metadata"""
+        # Replace TEST_TAGS:auto with actual tags
+        if parameters.get('TEST_TAGS') == 'auto':
+            parameters['TEST_TAGS'] = tags_ginkgo
+
+        if pr_info:
+            parameters['PR_NUMBER'] = str(pr_info['pr_number'])
+            parameters['PR_TITLE'] = pr_info['title']
+
+        if batch_mode:
+            parameters['BATCH_MODE'] = 'true'
+            parameters['PR_COUNT'] = str(pr_count)
+
+    @staticmethod
+    def _global_hub_jenkins_params(parameters: Dict, tags_ginkgo: str, pr_info: Dict,
+                                   batch_mode: bool, pr_count: int):
+        """Set TEST_TAGS and keep user-provided parameters"""
+        parameters['TEST_TAGS'] = tags_ginkgo
+
+    # component -> builder, looked up once per trigger instead of chained component checks
+    _JENKINS_TAG_BUILDERS = {'grc': _grc_jenkins_tags}
+    _JENKINS_PARAM_BUILDERS = {'global-hub': _global_hub_jenkins_params}
+
     def _trigger_jenkins_job(self, component: str, jenkins_job: str = None,
                             jenkins_params: str = None, selected_tags: Set[str] = None,
                             pr_info: Dict = None, batch_mode: bool = False,
@@ -1703,32 +2150,11 @@ class UnifiedPRTestSelector:
                     key, value = param.split(':', 1)
                     parameters[key.strip()] = value.strip()
 
-        # Optimize tags for Jenkins (prefer common functional tags over individual test numbers)
-        if component == 'grc' and selected_tests:
-            tags_ginkgo = self._optimize_tags_for_jenkins(selected_tests, component)
-        elif selected_tags:
-            # Convert tags to Ginkgo format (other components)
-            # NEVER use e2e tag as default - it runs ALL tests
-            tags_ginkgo = '||'.join(sorted(selected_tags))
-        else:
-            tags_ginkgo = ''
-
-        # For global-hub, set TEST_TAGS and keep user-provided parameters
-        if component == 'global-hub':
-            parameters['TEST_TAGS'] = tags_ginkgo
-        else:
-            # Replace TEST_TAGS:auto with actual tags for other components
-            if 'TEST_TAGS' in parameters and parameters['TEST_TAGS'] == 'auto':
-                parameters['TEST_TAGS'] = tags_ginkgo
-
-            # Add PR metadata for other components
-            if pr_info:
-                parameters['PR_NUMBER'] = str(pr_info['pr_number'])
-                parameters['PR_TITLE'] = pr_info['title']
-
-            if batch_mode:
-                parameters['BATCH_MODE'] = 'true'
-                parameters['PR_COUNT'] = str(pr_count)
+        # Component specific tag string and parameters, anything not listed uses the defaults
+        build_tags = self._JENKINS_TAG_BUILDERS.get(component, UnifiedPRTestSelector._jenkins_tags)
+        tags_ginkgo = build_tags(self, selected_tags, selected_tests)
+        fill_params = self._JENKINS_PARAM_BUILDERS.get(component, UnifiedPRTestSelector._jenkins_params)
+        fill_params(parameters, tags_ginkgo, pr_info, batch_mode, pr_count)
 
         # Trigger job
         jenkins = JenkinsJobTrigger(self.jenkins_url)
@@ -1749,6 +2175,9 @@ Examples:
 
   # With Jenkins trigger
   %(prog)s --pr "..." --trigger --jenkins-params "HUB_PASSWORD:xxx,TEST_TAGS:auto"
+
+  # Re-run against the test repository cached by an earlier run, without fetching it
+  %(prog)s --pr "..." --offline
         """
     )
 
@@ -1766,13 +2195,24 @@ Examples:
     # Other options
     parser.add_argument('--output', help='Output directory', default='./test-selection')
     parser.add_argument('--github-token', help='GitHub API token')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Clone the test repository into a temporary directory instead of reusing ~/.cache/acm-qe-assistant')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Do not list every changed file and tag, only the summaries')
+    parser.add_argument('--offline', action='store_true',
+                        help='Use the cached test repository and tag index as they are, without fetching updates')
 
     args = parser.parse_args()
+    if args.offline and args.no_cache:
+        parser.error('--offline needs the cached test repository, it cannot be combined with --no-cache')
 
     try:
         selector = UnifiedPRTestSelector(
             github_token=args.github_token,
-            jenkins_url=args.jenkins_url
+            jenkins_url=args.jenkins_url,
+            use_cache=not args.no_cache,
+            verbose=not args.quiet,
+            offline=args.offline
         )
 
         if args.pr:
@@ -3,7 +3,9 @@ import re
 from typing import Dict, List
 from urllib.parse import urlparse
 
-from streamlit import html
+# Steps mentioning any of these are UI work and get a Cypress script, one case-insensitive scan per step.
+# "ui" only as a whole word, as a substring it would match e.g. "build" or "guide".
+_CYPRESS_KW_RE = re.compile(r"policy|page|browser|button|\bui\b", re.IGNORECASE)
 
 def extract_component_from_url(url: str) -> str | None:
     try:
@@ -17,14 +19,14 @@ def extract_component_from_url(url: str) -> str | None:
             # extract grc
             component = last_job.split("-")[0]  
             return component
-        print (f"Component name is: {component}")
     except Exception as e:
         print("extract_component_from_url error:", e)
     return None
     
 
 def load_rules(md_file: str) -> dict:
-        component_guidelines = defaultdict(str)
+        # lines are collected per component and joined once, not concatenated line by line
+        component_guidelines = defaultdict(list)
         current_component = None
         try:
             with open(md_file, 'r', encoding='utf-8') as f:
@@ -32,21 +34,17 @@ def load_rules(md_file: str) -> dict:
                  if line.startswith("## Component Name "):
                   current_component = line.replace("## Component Name", "").strip()
                  elif current_component:
-                   component_guidelines[current_component] += line
+                   component_guidelines[current_component].append(line)
         except Exception as e:
             raise ValueError(f"can not load the file: {str(e)}")
+        return {component: "".join(lines) for component, lines in component_guidelines.items()}
         
 #def generate_test_script(ai_client, feature_description):
  #       prompt = f"Please generate an automated test scripts for the following feature: {feature_description}"
  #       return ai_client.chat([{"role": "user", "content": prompt}])
 
 def generate_test_script(ai_client, feature_description):
-    keywords = ["policy", "page", "browser", "UI", "button"]
-    if any(
-    kw in item.get("step", "").lower()
-    for item in feature_description
-    for kw in keywords
-):
+    if any(_CYPRESS_KW_RE.search(item.get("step", "")) for item in feature_description):
         framework = "cypress"
         language = "JavaScript"
         description = "You are a QA automation engineer experienced with Cypress, the JavaScript end-to-end testing framework."